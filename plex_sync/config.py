@@ -1,5 +1,6 @@
+import copy
+import functools
 import os
-import yaml
 from pathlib import Path
 
 # Default configuration
@@ -12,6 +13,13 @@ DEFAULT_CONFIG = {
         "server_path": "",
         "target": "",
         "options": "-avP",
+        # Passed to ssh for remote transfers; the control socket lets
+        # concurrent and consecutive rsyncs share one SSH connection
+        "ssh_options": (
+            "-o ControlMaster=auto"
+            " -o ControlPath=~/.ssh/controlmasters/%r@%h:%p"
+            " -o ControlPersist=600"
+        ),
     },
     "radarr": {
         "url": "",
@@ -26,41 +34,104 @@ DEFAULT_CONFIG = {
 }
 
 
-def get_config_path():
-    """Get the path to the config file."""
-    # Check for config in current directory first
-    local_config = Path.cwd() / "config.yml"
-    if local_config.exists():
-        return local_config
+# Episodes synced per show when neither the show nor sync.defaults set a limit
+DEFAULT_EPISODE_LIMIT = 10
+
+# Config file names checked in each directory, in priority order
+CONFIG_FILENAMES = ("config.toml", "config.yml")
+
 
-    # Check for config in user's home directory
-    home_config = Path.home() / ".config" / "plex-sync" / "config.yml"
-    if home_config.exists():
-        return home_config
+@functools.lru_cache(maxsize=1)
+def _candidate_config_paths():
+    """Return the default config file locations in priority order.
 
-    # Check for config in XDG_CONFIG_HOME
+    Resolving the working directory, home directory and XDG_CONFIG_HOME is
+    done once per process; call ``cache_clear()`` to recompute them.
+    """
+    # Check for config in current directory first, then the user's home
+    # directory, then XDG_CONFIG_HOME
+    config_dirs = [Path.cwd(), Path.home() / ".config" / "plex-sync"]
     xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
     if xdg_config_home:
-        xdg_config = Path(xdg_config_home) / "plex-sync" / "config.yml"
-        if xdg_config.exists():
-            return xdg_config
+        config_dirs.append(Path(xdg_config_home) / "plex-sync")
+
+    return tuple(
+        config_dir / filename
+        for config_dir in config_dirs
+        for filename in CONFIG_FILENAMES
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def read_config_file():
+    """Find and read the config file.
+
+    Returns a ``(path, content)`` tuple. ``path`` is None when no config file
+    was found, and ``content`` is None when the file exists but could not be
+    read. Candidates are opened directly rather than checked with
+    ``exists()`` first, so each location costs a single syscall and the file
+    cannot disappear between the check and the read.
+
+    The result is cached for the process lifetime; call ``cache_clear()``
+    to force a fresh search. Setting ``PLEX_SYNC_CONFIG`` skips the search
+    and uses that file directly; if it does not exist, a warning is printed
+    and no config file is used, so caches fall back to their default
+    locations too.
+    """
+    # An explicit config path wins and avoids probing the default locations
+    explicit_config = os.environ.get("PLEX_SYNC_CONFIG")
+    if explicit_config:
+        candidates = [Path(explicit_config).expanduser()]
+    else:
+        candidates = _candidate_config_paths()
+
+    for candidate in candidates:
+        try:
+            with open(candidate, "r") as file:
+                return candidate, file.read()
+        except FileNotFoundError:
+            if explicit_config:
+                print(f"Warning: Config file {candidate} from PLEX_SYNC_CONFIG not found")
+                return None, None
+        except OSError:
+            # Present but unreadable; load_config reports the error
+            return candidate, None
+
+    return None, None
 
-    return None
+
+def get_config_path():
+    """Get the path to the config file."""
+    return read_config_file()[0]
 
 
 def load_config():
-    """Load configuration from environment variables or config file."""
-    config = DEFAULT_CONFIG.copy()
+    """Load configuration from environment variables or config file.
+
+    The file is read and merged once per process; every call returns its own
+    deep copy of that result, so one caller changing its config never
+    affects another. Call ``load_config.cache_clear()`` to reload.
+    """
+    return copy.deepcopy(_load_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config():
+    """Build the configuration that ``load_config`` hands out copies of."""
+    # Deep copy so merging never mutates the nested defaults
+    config = copy.deepcopy(DEFAULT_CONFIG)
 
     # Try to load from config file
-    config_path = get_config_path()
+    config_path, content = read_config_file()
     if config_path:
         try:
-            with open(config_path, "r") as file:
-                file_config = yaml.safe_load(file)
-                if file_config:
-                    # Merge configurations
-                    deep_update(config, file_config)
+            if content is None:
+                # Re-read so the underlying error is reported
+                content = config_path.read_text()
+            file_config = parse_config(config_path, content)
+            if file_config:
+                # Merge configurations
+                deep_update(config, file_config)
         except Exception as e:
             print(f"Warning: Error reading config file: {e}")
 
@@ -76,17 +147,86 @@ def load_config():
     return config
 
 
+def cache_clear():
+    """Forget the config file search, its content and the merged config.
+
+    The next ``load_config()`` searches for and re-reads the file.
+    """
+    _candidate_config_paths.cache_clear()
+    read_config_file.cache_clear()
+    _load_config.cache_clear()
+
+
+# Keep load_config.cache_clear() working for callers that reload the config
+load_config.cache_clear = cache_clear
+
+
+def parse_config(path, content):
+    """Parse config file content, choosing TOML or YAML from the file suffix."""
+    if path.suffix == ".toml":
+        import tomllib
+
+        return tomllib.loads(content)
+
+    # PyYAML is only needed for YAML config files
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
+
+def plan_sync(cfg) -> list[tuple[str, list[tuple[str, int]]]]:
+    """Normalise the ``sync`` config section into per-library show tasks.
+
+    Returns ``(library_name, [(show_name, episode_limit), ...])`` pairs in
+    config order. Show entries may be plain names or dicts with ``name`` and
+    an optional ``episode_limit``; missing limits fall back to
+    ``sync.defaults.episode_limit`` and then to ``DEFAULT_EPISODE_LIMIT``.
+    """
+    sync_config = cfg.get("sync") or {}
+    defaults = sync_config.get("defaults") or {}
+    default_episode_limit = defaults.get("episode_limit", DEFAULT_EPISODE_LIMIT)
+
+    plan = []
+    for library_name, shows in sync_config.items():
+        # Skip the defaults section
+        if library_name == "defaults":
+            continue
+
+        tasks = []
+        for show_config in shows or []:
+            if isinstance(show_config, dict) and "name" in show_config:
+                tasks.append(
+                    (
+                        show_config["name"],
+                        show_config.get("episode_limit", default_episode_limit),
+                    )
+                )
+            else:
+                tasks.append((show_config, default_episode_limit))
+        plan.append((library_name, tasks))
+
+    return plan
+
+
 def deep_update(source, overrides):
-    """Recursively update a nested dictionary."""
-    for key, value in overrides.items():
-        if isinstance(value, dict) and key in source and isinstance(source[key], dict):
-            deep_update(source[key], value)
-        else:
-            source[key] = value
+    """Update a nested dictionary in place, merging nested dicts."""
+    stack = [(source, overrides)]
+    while stack:
+        target, updates = stack.pop()
+        for key, value in updates.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
 
 
 def create_default_config(path=None):
     """Create a default configuration file."""
+    import yaml
+
     if path is None:
         # Create in user's config directory
         config_dir = Path.home() / ".config" / "plex-sync"
@@ -98,6 +238,15 @@ def create_default_config(path=None):
 
     # Write the default config
     with open(path, "w") as file:
-        yaml.dump(DEFAULT_CONFIG, file, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            DEFAULT_CONFIG,
+            file,
+            Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            default_flow_style=False,
+            sort_keys=False,
+        )
+
+    # A new file may change which config is found and what it contains
+    cache_clear()
 
     return path
@@ -1,16 +1,63 @@
 import click
-from plexapi.server import PlexServer
-from plexapi.exceptions import Unauthorized, NotFound
 from . import config
-from typing import Dict, Any, cast, List, Optional
+import functools
+import heapq
 import os
 import subprocess
-import sys
 import json
+import queue
+import sys
+import threading
+import time
 from pathlib import Path
-from textual.app import App, ComposeResult
-from textual.widgets import DataTable
-from textual.containers import Container
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# Number of concurrent Plex requests used when fetching episodes for many shows
+EPISODE_FETCH_WORKERS = 8
+
+# Where OpenSSH keeps the control sockets used to multiplex rsync transfers
+SSH_CONTROL_DIR = Path.home() / ".ssh" / "controlmasters"
+
+# How much trailing rsync output (in characters) to keep for error reports
+RSYNC_ERROR_TAIL_CHARS = 1024
+
+# Cached per-show episode lists older than this (in seconds) are refetched
+SHOW_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+
+def plex_errors(func=None, *, prefix="Error"):
+    """Report errors from a command and exit with status 1.
+
+    Unauthorized Plex access gets a dedicated message; anything else is
+    printed as ``"{prefix}: {error}"``. Use as ``@plex_errors`` or
+    ``@plex_errors(prefix=...)`` directly above the function, below the Click
+    decorators.
+    """
+    if func is None:
+        return functools.partial(plex_errors, prefix=prefix)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            from plexapi.exceptions import Unauthorized
+
+            if isinstance(e, Unauthorized):
+                click.echo(
+                    "Error: Unauthorized access to Plex server. Check your token and URL."
+                )
+            else:
+                click.echo(f"{prefix}: {str(e)}")
+            sys.exit(1)
+
+    return wrapper
 
 
 @click.group()
@@ -26,140 +73,90 @@ def list():
 
 
 @list.command()
+@plex_errors(prefix="Error connecting to Plex server")
 def libraries():
     """List all libraries on the Plex server."""
     click.echo("Listing libraries")
-    try:
-        sections = get_plex_server().library.sections()
+    sections = get_plex_server().library.sections()
 
-        for section in sections:
-            click.echo(f"- {section.title} ({section.type})")
-    except Unauthorized:
-        click.echo(
-            "Error: Unauthorized access to Plex server. Check your token and URL."
-        )
-        exit(1)
-    except Exception as e:
-        click.echo(f"Error connecting to Plex server: {str(e)}")
-        exit(1)
+    for section in sections:
+        click.echo(f"- {section.title} ({section.type})")
 
 
 @list.command()
 @click.argument("name")
+@plex_errors(prefix="Error connecting to Plex server")
 def library(name):
     """List unwatched content from a specific library."""
     click.echo(f"Listing unwatched from library '{name}'")
-    try:
-        sections = get_plex_server().library.sections()
-
-        for section in sections:
-            if section.title == name:
-                if section.type == "show":
-                    print_unwatched_shows(section.all())
-                elif section.type == "movie":
-                    print_unwatched_movies(section.all())
-                return
-
-        click.echo(f"Library '{name}' not found.")
-    except Unauthorized:
-        click.echo(
-            "Error: Unauthorized access to Plex server. Check your token and URL."
-        )
-        exit(1)
-    except Exception as e:
-        click.echo(f"Error connecting to Plex server: {str(e)}")
-        exit(1)
+    sections = get_plex_server().library.sections()
 
+    for section in sections:
+        if section.title == name:
+            if section.type == "show":
+                print_unwatched_shows(section.search(unwatched=True, libtype="show"))
+            elif section.type == "movie":
+                print_unwatched_movies(section.search(unwatched=True, libtype="movie"))
+            return
 
-class LibraryListApp(App):
-    """Textual app for displaying library content table."""
-    
-    def __init__(self, content_data, content_type):
-        super().__init__()
-        self.content_data = content_data
-        self.content_type = content_type
-    
-    def compose(self) -> ComposeResult:
-        yield Container(
-            DataTable(id="content_table")
-        )
-    
-    def on_mount(self) -> None:
-        table = self.query_one("#content_table", DataTable)
-        table.cursor_type = "row"
-        
-        if self.content_type == "show":
-            table.add_columns("Show", "Total Episodes", "Unwatched", "% Unwatched")
-            
-            for show_data in self.content_data:
-                show_title = show_data["title"]
-                total_episodes = show_data["total_episodes"]
-                unwatched_episodes = show_data["unwatched_episodes"]
-                unwatched_percentage = (unwatched_episodes / total_episodes * 100) if total_episodes > 0 else 0
-                
-                table.add_row(
-                    show_title,
-                    str(total_episodes),
-                    str(unwatched_episodes),
-                    f"{unwatched_percentage:.1f}%"
-                )
-        elif self.content_type == "movie":
-            table.add_columns("Movie", "Year", "Duration")
-            
-            for movie_data in self.content_data:
-                movie_title = movie_data["title"]
-                year = str(movie_data.get("year", ""))
-                duration = movie_data.get("duration", "")
-                
-                table.add_row(movie_title, year, duration)
+    click.echo(f"Library '{name}' not found.")
 
 
 def print_unwatched_movies(movies):
-    """Display unwatched movies in a table."""
+    """Display unwatched movies in a table.
+
+    ``movies`` is expected to be pre-filtered to unwatched items, e.g. with
+    ``section.search(unwatched=True)``.
+    """
     movies_data = []
     for movie in movies:
-        if movie.isWatched is False:
-            duration_display = ""
-            if hasattr(movie, 'duration') and movie.duration:
-                hours = movie.duration // (1000 * 60 * 60)
-                minutes = (movie.duration % (1000 * 60 * 60)) // (1000 * 60)
-                duration_display = f"{hours}h {minutes}m"
-            
-            movies_data.append({
-                "title": movie.title,
-                "year": movie.year,
-                "duration": duration_display
-            })
+        # Plex durations are in milliseconds
+        total_sec = (getattr(movie, "duration", 0) or 0) // 1000
+        hours, rem = divmod(total_sec, 3600)
+        duration_display = f"{hours}h {rem // 60}m" if total_sec else ""
+
+        movies_data.append({
+            "title": movie.title,
+            "year": movie.year,
+            "duration": duration_display
+        })
     
     if not movies_data:
         click.echo("No unwatched movies found.")
         return
     
+    from .tui import LibraryListApp
+
     app = LibraryListApp(movies_data, "movie")
     app.run()
 
 
 def print_unwatched_shows(shows):
-    """Display shows with unwatched episodes in a table."""
+    """Display shows with unwatched episodes in a table.
+
+    ``shows`` is expected to be pre-filtered to shows with unwatched episodes,
+    e.g. with ``section.search(unwatched=True)``.
+    """
     shows_data = []
     for show in shows:
-        episodes = show.episodes()
-        unwatched_episodes = [
-            episode for episode in episodes if episode.isWatched is False
-        ]
-        if len(unwatched_episodes) == 0:
+        # Episode counts come with the show listing, no per-show request needed
+        total_episodes = show.leafCount or 0
+        unwatched_count = total_episodes - (show.viewedLeafCount or 0)
+        if unwatched_count <= 0:
             continue
         
         shows_data.append({
             "title": show.title,
-            "total_episodes": len(episodes),
-            "unwatched_episodes": len(unwatched_episodes)
+            "total_episodes": total_episodes,
+            "unwatched_episodes": unwatched_count
         })
     
     if not shows_data:
         click.echo("No shows with unwatched episodes found.")
         return
     
+    from .tui import LibraryListApp
+
     app = LibraryListApp(shows_data, "show")
     app.run()
 
@@ -167,18 +164,10 @@ def print_unwatched_shows(shows):
 @list.command()
 @click.argument("show_name")
 @click.option("--library", "-l", default=None, help="Library name containing the show")
+@plex_errors
 def unwatched(show_name, library):
     """List unwatched episodes for a specific show."""
-    try:
-        get_unwatched_episodes(show_name, library)
-    except Unauthorized:
-        click.echo(
-            "Error: Unauthorized access to Plex server. Check your token and URL."
-        )
-        exit(1)
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        exit(1)
+    get_unwatched_episodes(show_name, library)
 
 
 @cli.command()
@@ -190,126 +179,62 @@ def unwatched(show_name, library):
     is_flag=True,
     help="Only perform the rsync operation on previously found files",
 )
+@plex_errors
 def sync(dry_run, rsync_only):
     """Sync unwatched episodes based on configuration."""
-    try:
-        print("Loading config")
-        cfg = config.load_config()
-
-        # Debug output to see what's in the config
-        print("Config loaded")
-
-        # Collect all file paths to sync
-        all_files_to_sync = []
-
-        if not rsync_only:
-            # Get default episode limit from config or use 10 if not specified
-            default_episode_limit = 10
-            if "defaults" in cfg["sync"] and "episode_limit" in cfg["sync"]["defaults"]:
-                sync_defaults = cast(Dict[str, Any], cfg["sync"]["defaults"])
-                default_episode_limit = sync_defaults["episode_limit"]
-
-            print("Connecting to Plex server")
-            plex = get_plex_server()
-            print("Connected to Plex server")
-
-            # Process each library in the sync config
-            for library_name, shows in cfg["sync"].items():
-                # Skip the defaults section
-                if library_name == "defaults":
-                    continue
-
-                click.echo(f"\n=== Library: {library_name} ===")
+    print("Loading config")
+    cfg = config.load_config()
 
-                # Find the library
-                library = None
-                for section in plex.library.sections():
-                    if section.title == library_name:
-                        library = section
-                        break
+    # Debug output to see what's in the config
+    print("Config loaded")
 
-                if not library:
-                    click.echo(
-                        f"Warning: Library '{library_name}' not found on Plex server. Skipping."
-                    )
-                    continue
+    if not rsync_only:
+        print("Connecting to Plex server")
+        plex = get_plex_server()
+        print("Connected to Plex server")
 
-                if not shows:
-                    click.echo(f"No shows configured for library '{library_name}'")
-                    continue
+        if not dry_run:
+            stream_sync(cfg, plex)
+            return
 
-                # Process each show in the library
-                for show_config in shows:
-                    # Handle both string format and dictionary format
-                    show_name = show_config
-                    episode_limit = default_episode_limit
-
-                    # If show_config is a dictionary with name and episode_limit
-                    if isinstance(show_config, dict) and "name" in show_config:
-                        show_dict = cast(Dict[str, Any], show_config)
-                        show_name = show_dict["name"]
-                        if "episode_limit" in show_dict:
-                            episode_limit = show_dict["episode_limit"]
-
-                    click.echo(
-                        f"\n--- {show_name} (Latest {episode_limit} episodes) ---"
-                    )
-                    try:
-                        episode_files = get_unwatched_episodes(
-                            show_name, library_name, episode_limit
-                        )
-                        all_files_to_sync.extend(episode_files)
-                    except ValueError as e:
-                        click.echo(f"Error: {str(e)}")
-                    except Exception as e:
-                        click.echo(f"Error processing '{show_name}': {str(e)}")
-
-            # Save the list of files for future rsync-only operations
-            if all_files_to_sync:
-                save_synced_files(all_files_to_sync)
-        else:
-            click.echo("Rsync-only mode: Loading previously synced files from cache")
-            all_files_to_sync = load_synced_files()
-            if not all_files_to_sync:
-                click.echo("No previously synced files found in cache")
-                return
+        all_files_to_sync, show_cache, file_sizes = collect_sync_files(cfg, plex)
 
-        # Sync all collected files
+        # Save the list of files for future rsync-only operations
         if all_files_to_sync:
-            click.echo(f"\nFound {len(all_files_to_sync)} files to sync")
-            if dry_run:
-                click.echo("Dry run mode - not actually syncing files")
-                for file_path in all_files_to_sync:
-                    click.echo(f"Would sync: {file_path}")
-            else:
-                sync_files_with_rsync(all_files_to_sync)
-        else:
-            click.echo("No files found to sync")
+            save_synced_files(all_files_to_sync, shows=show_cache, sizes=file_sizes)
+    else:
+        click.echo("Rsync-only mode: Loading previously synced files from cache")
+        all_files_to_sync = load_synced_files()
+        file_sizes = load_synced_file_sizes()
+        if not all_files_to_sync:
+            click.echo("No previously synced files found in cache")
+            return
 
-    except Unauthorized:
-        click.echo(
-            "Error: Unauthorized access to Plex server. Check your token and URL."
-        )
-        exit(1)
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        exit(1)
+    # Sync all collected files
+    if all_files_to_sync:
+        click.echo(f"\nFound {len(all_files_to_sync)} files to sync")
+        if dry_run:
+            click.echo("Dry run mode - not actually syncing files")
+            for file_path in all_files_to_sync:
+                click.echo(f"Would sync: {file_path}")
+        else:
+            sync_files_with_rsync(all_files_to_sync, cfg=cfg, file_sizes=file_sizes)
+    else:
+        click.echo("No files found to sync")
 
 
 @cli.command()
 def debug():
     """Debug command to print configuration information."""
-    config_path = config.get_config_path()
+    # read_config_file() is cached, so load_config() below reuses this read
+    config_path, content = config.read_config_file()
     click.echo(f"Config file path: {config_path}")
 
     if config_path:
-        click.echo(f"Config file exists: {config_path.exists()}")
-        try:
-            with open(config_path, "r") as file:
-                content = file.read()
-                click.echo(f"Config file content:\n{content}")
-        except Exception as e:
-            click.echo(f"Error reading config file: {e}")
+        if content is None:
+            click.echo("Error reading config file")
+        else:
+            click.echo(f"Config file content:\n{content}")
 
     cfg = config.load_config()
     click.echo(f"Loaded config: {cfg}")
@@ -319,35 +244,39 @@ def debug():
 @click.option(
     "--dry-run", is_flag=True, help="Show what would be synced without actually syncing"
 )
+@plex_errors
 def rsync(dry_run):
     """Sync previously found unwatched episodes using rsync."""
-    try:
-        click.echo("Loading previously synced files from cache")
-        files_to_sync = load_synced_files()
-
-        if not files_to_sync:
-            click.echo("No previously synced files found in cache")
-            return
+    click.echo("Loading previously synced files from cache")
+    files_to_sync = load_synced_files()
 
-        click.echo(f"Found {len(files_to_sync)} files to sync")
+    if not files_to_sync:
+        click.echo("No previously synced files found in cache")
+        return
 
-        if dry_run:
-            click.echo("Dry run mode - not actually syncing files")
-            for file_path in files_to_sync:
-                click.echo(f"Would sync: {file_path}")
-        else:
-            sync_files_with_rsync(files_to_sync)
+    click.echo(f"Found {len(files_to_sync)} files to sync")
 
-    except Exception as e:
-        click.echo(f"Error: {str(e)}")
-        exit(1)
+    if dry_run:
+        click.echo("Dry run mode - not actually syncing files")
+        for file_path in files_to_sync:
+            click.echo(f"Would sync: {file_path}")
+    else:
+        sync_files_with_rsync(files_to_sync, file_sizes=load_synced_file_sizes())
 
 
 cli.add_command(list)
 
 
+@functools.lru_cache(maxsize=1)
 def get_plex_server():
-    """Get a connection to the Plex server."""
+    """Get a connection to the Plex server.
+
+    The connection is created once and reused for the rest of the process.
+    """
+    import requests
+    from plexapi.server import PlexServer
+    from urllib3.util.retry import Retry
+
     cfg = config.load_config()
     url = cfg["plex"]["url"]
     token = cfg["plex"]["token"]
@@ -357,72 +286,147 @@ def get_plex_server():
             "Plex token not configured. Run 'plex-sync config' to create a config file."
         )
 
-    return PlexServer(url, token)
+    # Keep enough pooled connections for the concurrent episode fetches and
+    # retry transient gateway errors with backoff
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=max(20, EPISODE_FETCH_WORKERS),
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
 
+    return PlexServer(url, token, session=session)
 
-def get_unwatched_episodes(show_name, library_name=None, episode_limit=None):
-    """Get unwatched episodes for a specific show."""
-    # Get all shows
-    sections = get_plex_server().library.sections()
 
-    # Find the right library
-    target_section = None
-    if library_name:
-        for section in sections:
-            if section.type == "show" and section.title == library_name:
-                target_section = section
-                break
+def get_sections_by_title(plex=None):
+    """Map library section titles to sections, fetched once per server."""
+    if plex is None:
+        plex = get_plex_server()
+    return _sections_by_title(plex)
 
-        if not target_section:
-            raise ValueError(
-                f"Library '{library_name}' not found or is not a TV show library"
-            )
-    else:
-        # Try to find a TV show library
-        for section in sections:
-            if section.type == "show":
-                target_section = section
-                break
 
-        if not target_section:
-            raise ValueError("No TV show library found")
+@functools.lru_cache(maxsize=1)
+def _sections_by_title(plex):
+    return {section.title: section for section in plex.library.sections()}
 
-    # Get all shows from the library
-    shows = target_section.all()
 
-    # Find the specific show
-    target_show = None
-    for show in shows:
-        if show.title.lower() == show_name.lower():
-            target_show = show
-            break
+def fetch_unwatched_episodes(show, episode_limit=None, section=None):
+    """Fetch the unwatched episodes of a show, oldest air date first.
+
+    With an ``episode_limit`` the library search does the sorting and
+    limiting on the server, so only the episodes we keep are transferred. If
+    the server rejects the search, fall back to every unwatched episode and
+    let the caller pick the oldest ones.
+    """
+    from plexapi.exceptions import BadRequest, NotFound
+
+    if episode_limit:
+        try:
+            return (section or show.section()).search(
+                libtype="episode",
+                filters={"show.id": show.ratingKey, "episode.unwatched": True},
+                sort="originallyAvailableAt:asc",
+                maxresults=episode_limit,
+            )
+        except (BadRequest, NotFound):
+            pass
+
+    return show.unwatched()
+
+
+def get_unwatched_episodes(
+    show_name,
+    library_name=None,
+    episode_limit=None,
+    plex=None,
+    sections=None,
+    section=None,
+    show=None,
+    unwatched_episodes=None,
+    file_sizes=None,
+):
+    """Get unwatched episodes for a specific show.
+
+    Callers that already hold the ``sections`` title mapping, the library
+    ``section``, the resolved ``show`` or its prefetched
+    ``unwatched_episodes`` can pass them in to skip the corresponding Plex
+    lookups. If ``file_sizes`` is given, the size Plex reports for each file
+    is recorded in it by path.
+    """
+    target_section = section
+    target_show = show
+
+    if target_show is None and target_section is None:
+        if sections is None:
+            sections = get_sections_by_title(plex)
+
+        # Find the right library
+        if library_name:
+            candidate = sections.get(library_name)
+            if candidate is not None and candidate.type == "show":
+                target_section = candidate
+
+            if not target_section:
+                raise ValueError(
+                    f"Library '{library_name}' not found or is not a TV show library"
+                )
+        else:
+            # Try to find a TV show library
+            for candidate in sections.values():
+                if candidate.type == "show":
+                    target_section = candidate
+                    break
+
+            if not target_section:
+                raise ValueError("No TV show library found")
 
     if target_show is None:
-        raise ValueError(f"Show '{show_name}' not found in Plex library")
+        # Let the server narrow the title down instead of listing the whole
+        # library; its title search matches substrings, so keep exact matches
+        wanted_title = show_name.casefold()
+        for candidate in target_section.search(title=show_name, libtype="show"):
+            if candidate.title.casefold() == wanted_title:
+                target_show = candidate
+                break
 
-    # Get all episodes for the show
-    episodes = target_show.episodes()
+    if target_show is None:
+        raise ValueError(f"Show '{show_name}' not found in Plex library")
 
-    # Filter unwatched episodes
-    unwatched_episodes = [episode for episode in episodes if episode.isWatched is False]
+    # Let the Plex server filter out watched episodes
+    if unwatched_episodes is None:
+        unwatched_episodes = fetch_unwatched_episodes(
+            target_show, episode_limit, target_section
+        )
 
     if not unwatched_episodes:
         click.echo(f"No unwatched episodes found for '{show_name}'")
         return []
 
-    # Sort episodes by air date (oldest first) and limit if specified
-    unwatched_episodes.sort(
-        key=lambda x: x.originallyAvailableAt or x.addedAt, reverse=False
+    # A server-side limited fetch only returns the kept episodes, so take the
+    # total from the show's leaf counts
+    total_unwatched = max(
+        len(unwatched_episodes),
+        (target_show.leafCount or 0) - (target_show.viewedLeafCount or 0),
     )
 
-    if episode_limit and len(unwatched_episodes) > episode_limit:
-        limited_episodes = unwatched_episodes[:episode_limit]
-        click.echo(
-            f"Showing {episode_limit} latest unwatched episodes for '{target_show.title}' (out of {len(unwatched_episodes)} total):"
+    # Buffer the listing and write it in one go instead of once per line
+    output = []
+
+    if episode_limit and total_unwatched > episode_limit:
+        # Pick the oldest episodes by air date, only ordering the ones we keep
+        limited_episodes = heapq.nsmallest(
+            episode_limit,
+            unwatched_episodes,
+            key=lambda x: x.originallyAvailableAt or x.addedAt,
+        )
+        output.append(
+            f"Showing {episode_limit} latest unwatched episodes for '{target_show.title}' (out of {total_unwatched} total):"
         )
     else:
         limited_episodes = unwatched_episodes
-        click.echo(f"Unwatched episodes for '{target_show.title}':")
+        output.append(f"Unwatched episodes for '{target_show.title}':")
 
     # Sort limited episodes by season and episode for display
     limited_episodes.sort(key=lambda x: (x.seasonNumber or 0, x.episodeNumber or 0))
@@ -431,130 +435,246 @@ def get_unwatched_episodes(show_name, library_name=None, episode_limit=None):
     episode_files = []
 
     for episode in limited_episodes:
-        click.echo(
+        output.append(
             f"- {episode.title} (Season {episode.seasonNumber}, Episode {episode.episodeNumber})"
         )
         try:
-            file_path = episode.media[0].parts[0].file
-            click.echo(f"  {file_path}")
+            part = episode.media[0].parts[0]
+            file_path = part.file
+            output.append(f"  {file_path}")
             episode_files.append(file_path)
+            if file_sizes is not None and part.size:
+                file_sizes[file_path] = part.size
         except (IndexError, AttributeError):
-            click.echo("  (File path not available)")
+            output.append("  (File path not available)")
 
-    if episode_limit and len(unwatched_episodes) > episode_limit:
-        click.echo(
-            f"Total unwatched episodes: {len(unwatched_episodes)} (showing latest {len(limited_episodes)})"
+    if episode_limit and total_unwatched > episode_limit:
+        output.append(
+            f"Total unwatched episodes: {total_unwatched} (showing latest {len(limited_episodes)})"
         )
     else:
-        click.echo(f"Total unwatched episodes: {len(unwatched_episodes)}")
+        output.append(f"Total unwatched episodes: {total_unwatched}")
+
+    click.echo("\n".join(output))
 
     return episode_files
 
 
-def run_sync(rsync_only=False):
-    """Run the sync logic without Click's decorators."""
-    print("Running sync logic directly")
-    try:
-        cfg = config.load_config()
+def collect_sync_files(cfg, plex):
+    """Collect file paths of the unwatched episodes selected by the sync config.
+
+    Returns ``(file_paths, show_cache, file_sizes)``, see ``iter_sync_files``.
+    """
+    new_show_cache = {}
+    file_sizes = {}
+    file_paths = [*iter_sync_files(cfg, plex, new_show_cache, file_sizes)]
+    return file_paths, new_show_cache, file_sizes
+
+
+def iter_sync_files(cfg, plex, new_show_cache, file_sizes):
+    """Yield file paths of the unwatched episodes selected by the sync config.
+
+    Paths are yielded show by show as soon as each show is resolved, so a
+    consumer such as ``sync_files_with_rsync`` can start transferring while
+    later shows are still being queried. Shows whose fingerprint matches the
+    per-show cache from the previous run reuse the cached file list instead
+    of querying Plex. The refreshed per-show cache is written into
+    ``new_show_cache`` and the sizes Plex reports into ``file_sizes`` (by
+    path) before the show's paths are yielded.
+    """
+    show_cache = load_show_cache()
+    plan = config.plan_sync(cfg)
+    sections_by_title = get_sections_by_title(plex)
+
+    with ThreadPoolExecutor(max_workers=EPISODE_FETCH_WORKERS) as executor:
+        # Start fetching the show listing of every usable library at once
+        listings = {}
+        for library_name, tasks in plan:
+            library = sections_by_title.get(library_name)
+            if tasks and library is not None and library.type == "show":
+                listings[library_name] = executor.submit(library.all)
+
+        # As each listing arrives, index it for case-insensitive lookups and
+        # queue the unwatched-episode fetch of every configured show that is
+        # not cached, so requests for all libraries overlap
+        pending = {}
+        listing_errors = {}
+        for library_name, tasks in plan:
+            if library_name not in listings:
+                continue
+
+            library = sections_by_title[library_name]
+            try:
+                listing = listings[library_name].result()
+            except Exception as e:
+                # Reported below in config order; other libraries carry on
+                listing_errors[library_name] = e
+                continue
+            shows_by_title = {s.title.casefold(): s for s in listing}
+            pending[library_name] = []
+            for show_name, episode_limit in tasks:
+                show = shows_by_title.get(show_name.casefold())
+                future = fingerprint = cached = None
+                if show is not None:
+                    fingerprint = show_cache_fingerprint(show, episode_limit)
+                    cached = show_cache.get(str(show.ratingKey))
+                    if not cached or cached.get("fingerprint") != fingerprint:
+                        cached = None
+                        future = executor.submit(
+                            fetch_unwatched_episodes, show, episode_limit, library
+                        )
+                pending[library_name].append(
+                    (show_name, episode_limit, show, future, fingerprint, cached)
+                )
 
-        # Check if sync configuration exists
-        if "sync" not in cfg:
-            print("Error: No sync configuration found in config file.")
-            return
+        # Report results in config order from this thread so output stays
+        # readable
+        for library_name, tasks in plan:
+            click.echo(f"\n=== Library: {library_name} ===")
 
-        # Collect all file paths to sync
-        all_files_to_sync = []
+            # Find the library
+            library = sections_by_title.get(library_name)
 
-        if not rsync_only:
-            # Get default episode limit from config or use 10 if not specified
-            default_episode_limit = 10
-            if "defaults" in cfg["sync"] and "episode_limit" in cfg["sync"]["defaults"]:
-                sync_defaults = cast(Dict[str, Any], cfg["sync"]["defaults"])
-                default_episode_limit = sync_defaults["episode_limit"]
+            if not library:
+                click.echo(
+                    f"Warning: Library '{library_name}' not found on Plex server. Skipping."
+                )
+                continue
+
+            if library.type != "show":
+                click.echo(
+                    f"Warning: Library '{library_name}' is not a TV show library. Skipping."
+                )
+                continue
 
-            plex = get_plex_server()
+            if not tasks:
+                click.echo(f"No shows configured for library '{library_name}'")
+                continue
 
-            # Process each library in the sync config
-            for library_name, shows in cfg["sync"].items():
-                # Skip the defaults section
-                if library_name == "defaults":
+            if library_name in listing_errors:
+                click.echo(
+                    f"Error processing library '{library_name}': {str(listing_errors[library_name])}"
+                )
+                continue
+
+            for show_name, episode_limit, show, future, fingerprint, cached in pending[
+                library_name
+            ]:
+                click.echo(f"\n--- {show_name} (Latest {episode_limit} episodes) ---")
+                try:
+                    if show is None:
+                        raise ValueError(f"Show '{show_name}' not found in Plex library")
+
+                    if cached is not None:
+                        episode_files = cached["files"]
+                        show_sizes = cached.get("sizes", {})
+                        output = [
+                            f"Unchanged since last sync, reusing cached files for '{show.title}':"
+                        ]
+                        output.extend(f"  {file_path}" for file_path in episode_files)
+                        click.echo("\n".join(output))
+                        new_show_cache[str(show.ratingKey)] = cached
+                    else:
+                        show_sizes = {}
+                        episode_files = get_unwatched_episodes(
+                            show_name,
+                            library_name,
+                            episode_limit,
+                            show=show,
+                            unwatched_episodes=future.result(),
+                            file_sizes=show_sizes,
+                        )
+                        new_show_cache[str(show.ratingKey)] = {
+                            "fingerprint": fingerprint,
+                            "files": episode_files,
+                            "sizes": show_sizes,
+                            "cachedAt": time.time(),
+                        }
+                except ValueError as e:
+                    click.echo(f"Error: {str(e)}")
+                    continue
+                except Exception as e:
+                    click.echo(f"Error processing '{show_name}': {str(e)}")
                     continue
 
-                print(f"\n=== Library: {library_name} ===")
+                file_sizes.update(show_sizes)
+                yield from episode_files
 
-                # Find the library
-                library = None
-                for section in plex.library.sections():
-                    if section.title == library_name:
-                        library = section
-                        break
 
-                if not library:
-                    print(
-                        f"Warning: Library '{library_name}' not found on Plex server. Skipping."
-                    )
-                    continue
+def stream_sync(cfg, plex):
+    """Query Plex and rsync the selected files in one pipelined pass.
 
-                if not shows:
-                    print(f"No shows configured for library '{library_name}'")
-                    continue
+    Paths from ``iter_sync_files`` go straight into rsync, so the first
+    transfers start while later shows are still being looked up. The
+    discovered file list is saved for rsync-only runs once discovery is done.
+    """
+    all_files_to_sync = []
+    show_cache = {}
+    file_sizes = {}
 
-                # Process each show in the library
-                for show_config in shows:
-                    # Handle both string format and dictionary format
-                    show_name = show_config
-                    episode_limit = default_episode_limit
-
-                    # If show_config is a dictionary with name and episode_limit
-                    if isinstance(show_config, dict) and "name" in show_config:
-                        show_dict = cast(Dict[str, Any], show_config)
-                        show_name = show_dict["name"]
-                        if "episode_limit" in show_dict:
-                            episode_limit = show_dict["episode_limit"]
-
-                    print(f"\n--- {show_name} (Latest {episode_limit} episodes) ---")
-                    try:
-                        episode_files = get_unwatched_episodes(
-                            show_name, library_name, episode_limit
-                        )
-                        all_files_to_sync.extend(episode_files)
-                    except ValueError as e:
-                        print(f"Error: {str(e)}")
-                    except Exception as e:
-                        print(f"Error processing '{show_name}': {str(e)}")
-
-            # Save the list of files for future rsync-only operations
-            if all_files_to_sync:
-                save_synced_files(all_files_to_sync)
-        else:
-            print("Rsync-only mode: Loading previously synced files from cache")
-            all_files_to_sync = load_synced_files()
-            if not all_files_to_sync:
-                print("No previously synced files found in cache")
-                return
+    def discovered():
+        for file_path in iter_sync_files(cfg, plex, show_cache, file_sizes):
+            all_files_to_sync.append(file_path)
+            yield file_path
 
-        # Sync all collected files
+    files = discovered()
+    try:
+        sync_files_with_rsync(files, cfg=cfg, file_sizes=file_sizes)
+
+        # rsync stops early on a configuration error; finish discovery so the
+        # saved cache is still complete
+        for _ in files:
+            pass
+    finally:
+        # Save the list of files for future rsync-only operations, keeping
+        # the shows that were done even if discovery failed part way
         if all_files_to_sync:
-            print(f"\nFound {len(all_files_to_sync)} files to sync")
-            sync_files_with_rsync(all_files_to_sync)
-        else:
-            print("No files found to sync")
+            save_synced_files(all_files_to_sync, shows=show_cache, sizes=file_sizes)
 
-    except Unauthorized:
-        print("Error: Unauthorized access to Plex server. Check your token and URL.")
-        exit(1)
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        exit(1)
 
+@plex_errors
+def run_sync(rsync_only=False):
+    """Run the sync logic without Click's decorators."""
+    print("Running sync logic directly")
+    cfg = config.load_config()
 
-def sync_files_with_rsync(file_paths):
-    """Sync files using rsync based on configuration."""
-    if not file_paths:
-        click.echo("No files to sync")
+    # Check if sync configuration exists
+    if "sync" not in cfg:
+        print("Error: No sync configuration found in config file.")
         return
 
-    cfg = config.load_config()
+    if not rsync_only:
+        stream_sync(cfg, get_plex_server())
+        return
+
+    print("Rsync-only mode: Loading previously synced files from cache")
+    all_files_to_sync = load_synced_files()
+    file_sizes = load_synced_file_sizes()
+    if not all_files_to_sync:
+        print("No previously synced files found in cache")
+        return
+
+    print(f"\nFound {len(all_files_to_sync)} files to sync")
+    sync_files_with_rsync(all_files_to_sync, cfg=cfg, file_sizes=file_sizes)
+
+
+def sync_files_with_rsync(file_paths, cfg=None, file_sizes=None):
+    """Sync files using rsync based on configuration.
+
+    ``file_paths`` may be any iterable, such as the generator returned by
+    ``iter_sync_files``: each path is handed to a running rsync as soon as it
+    arrives, so transfers overlap with whatever produces the paths.
+    ``cfg`` defaults to ``config.load_config()``.
+    ``file_sizes`` optionally maps source paths to their size; local
+    destination files that already have that size are skipped without
+    passing them to rsync. It is read lazily, so the producer may keep
+    filling it while paths are consumed.
+    """
+    if cfg is None:
+        cfg = config.load_config()
+
+    if file_sizes is None:
+        file_sizes = {}
 
     # Check if rsync configuration exists
     if "rsync" not in cfg:
@@ -573,46 +693,211 @@ def sync_files_with_rsync(file_paths):
         click.echo("Error: target not configured in rsync settings")
         return
 
-    click.echo(f"\n=== Syncing {len(file_paths)} files with rsync ===")
-
-    for file_path in file_paths:
-        # Convert server-side path to local path by removing the server_path prefix
-        if server_path and file_path.startswith(server_path):
-            relative_path = file_path[len(server_path) :].lstrip("/")
-        else:
-            # If the file path doesn't start with server_path, use the full path
-            # This might happen if the server_path is not correctly configured
-            click.echo(
-                f"Warning: File path {file_path} doesn't start with server_path {server_path}"
-            )
-            relative_path = file_path.lstrip("/")
-
-        # Construct the destination path
-        dest_path = f"{target}{relative_path}"
-
-        click.echo(f"Syncing: {file_path} -> {dest_path}")
+    # Multiplex remote transfers over one SSH connection unless the user
+    # already chose a remote shell in the rsync options
+    rsync_opts = rsync_options.split()
+    ssh_options = cfg["rsync"].get("ssh_options", "")
+    if any(opt == "-e" or opt.startswith("--rsh") for opt in rsync_opts):
+        ssh_options = ""
+
+    click.echo("\n=== Syncing files with rsync ===")
+
+    # One rsync per source root reads the paths relative to that root from
+    # stdin (--files-from), so every file under server_path goes through a
+    # single handshake; paths outside server_path get a process rooted at /
+    transfers = {}
+    output_lines = queue.Queue()
+    seen = set()
+    prefix = server_path.rstrip("/") + "/"
+    prefix_len = len(prefix)
+    target_dir = target.rstrip("/") + "/"
+    target_is_remote = is_remote_rsync_path(target_dir)
+    listed = False
+    try:
+        for file_path in file_paths:
+            # The same episode can be configured under several libraries
+            if file_path in seen:
+                continue
+            seen.add(file_path)
+
+            # Convert server-side path to local path by removing the server_path prefix
+            if file_path.startswith(prefix):
+                source_root = prefix
+                relative_path = file_path[prefix_len:]
+            else:
+                # If the file path doesn't start with server_path, use the full path
+                # This might happen if the server_path is not correctly configured
+                click.echo(
+                    f"Warning: File path {file_path} doesn't start with server_path {server_path}"
+                )
+                source_root = "/"
+                relative_path = file_path.lstrip("/")
+
+            # Construct the destination path
+            dest_path = f"{target_dir}{relative_path}"
+
+            # Skip files already copied in full; anything inconclusive goes to rsync
+            expected_size = file_sizes.get(file_path)
+            if expected_size and not target_is_remote:
+                try:
+                    if os.stat(dest_path).st_size == expected_size:
+                        click.echo(f"Already up to date: {dest_path}")
+                        continue
+                except OSError:
+                    pass
+
+            click.echo(f"Syncing: {file_path} -> {dest_path}")
+
+            transfer = transfers.get(source_root)
+            if transfer is None:
+                # --files-from implies --relative, so rsync recreates the
+                # directories below the target itself
+                if not target_is_remote:
+                    os.makedirs(target_dir, exist_ok=True)
+
+                # Construct the rsync command
+                # The source_root is the media root on the Plex server
+                # The target_dir is where we want to copy the files to locally
+                rsync_cmd = ["rsync"]
+                rsync_cmd.extend(rsync_opts)
+                if ssh_options and (target_is_remote or is_remote_rsync_path(source_root)):
+                    # The master connection stays open for the next run
+                    SSH_CONTROL_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+                    rsync_cmd.extend(["-e", f"ssh {ssh_options}"])
+                # NUL-separated so paths containing spaces or newlines stay intact
+                rsync_cmd.extend(["--files-from=-", "--from0", source_root, target_dir])
+
+                click.echo(f"Running: {' '.join(rsync_cmd)}")
+                try:
+                    transfer = RsyncTransfer(rsync_cmd, output_lines)
+                except Exception as e:
+                    click.echo(f"Error executing rsync: {str(e)}")
+                    return
+                transfers[source_root] = transfer
+
+            transfer.send(file_path, relative_path)
+            _echo_rsync_output(output_lines)
+        listed = True
+    finally:
+        if not listed:
+            # The file list failed or setup stopped early; don't leave the
+            # rsyncs that already started waiting for more paths
+            for transfer in transfers.values():
+                transfer.abort()
+            _echo_rsync_output(output_lines)
+
+    if not seen:
+        click.echo("No files to sync")
+        return
 
-        # Construct the rsync command
-        # The file_path is the source on the Plex server
-        # The dest_path is where we want to copy it to locally
-        rsync_cmd = ["rsync"]
-        rsync_cmd.extend(rsync_options.split())
-        rsync_cmd.append(file_path)
-        rsync_cmd.append(dest_path)
+    if not transfers:
+        click.echo("All files are already up to date")
+        return
 
+    # Let every rsync see the end of its list, then keep printing their
+    # output from this thread until they exit so lines never tear
+    for transfer in transfers.values():
+        transfer.close_input()
+    while any(transfer.running() for transfer in transfers.values()):
+        _echo_rsync_output(output_lines, timeout=0.1)
+    _echo_rsync_output(output_lines)
+
+    for transfer in transfers.values():
+        returncode, output_tail = transfer.result()
+        if returncode == 0:
+            for file_path in transfer.sources:
+                click.echo(f"Successfully synced: {file_path}")
+        else:
+            click.echo(f"Error syncing {', '.join(transfer.sources)}: {output_tail}")
+
+
+class RsyncTransfer:
+    """A running ``rsync --files-from=- --from0`` fed one path at a time.
+
+    Output is forwarded line by line into ``output_lines`` by a reader
+    thread; only the last ``RSYNC_ERROR_TAIL_CHARS`` or so is kept for error
+    reports, so memory stays bounded however much rsync prints.
+    """
+
+    def __init__(self, rsync_cmd, output_lines):
+        self.sources = []
+        self._output_lines = output_lines
+        self._tail = deque()
+        self._tail_len = 0
+        self._proc = subprocess.Popen(
+            rsync_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        # Read from another thread so a long list can't deadlock against
+        # rsync filling its output pipe
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+
+    def _read_output(self):
+        for line in self._proc.stdout:
+            self._output_lines.put(line)
+            self._tail.append(line)
+            self._tail_len += len(line)
+            while self._tail_len > RSYNC_ERROR_TAIL_CHARS and len(self._tail) > 1:
+                self._tail_len -= len(self._tail.popleft())
+
+    def send(self, source, relative_path):
+        """Queue one file, given by its path relative to the source root."""
+        self.sources.append(source)
         try:
-            # Execute the rsync command
-            click.echo(f"Running: {' '.join(rsync_cmd)}")
-            result = subprocess.run(
-                rsync_cmd, capture_output=True, text=True, check=False
-            )
+            self._proc.stdin.write(f"{relative_path}\0")
+            self._proc.stdin.flush()
+        except OSError:
+            # rsync already exited; result() reports why
+            pass
+
+    def close_input(self):
+        """Signal the end of the file list."""
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+
+    def abort(self):
+        """Stop rsync without waiting for the rest of the list."""
+        self.close_input()
+        if self._proc.poll() is None:
+            self._proc.terminate()
+        self._proc.wait()
+        self._reader.join()
+        self._proc.stdout.close()
+
+    def running(self):
+        return self._proc.poll() is None or self._reader.is_alive()
+
+    def result(self):
+        """Wait for rsync to exit and return ``(returncode, output_tail)``."""
+        self.close_input()
+        returncode = self._proc.wait()
+        self._reader.join()
+        self._proc.stdout.close()
+        return returncode, "".join(self._tail)
+
+
+def _echo_rsync_output(output_lines, timeout=None):
+    """Print pending rsync output, waiting up to ``timeout`` for the first line."""
+    if timeout is not None:
+        try:
+            click.echo(output_lines.get(timeout=timeout), nl=False)
+        except queue.Empty:
+            return
+    while not output_lines.empty():
+        click.echo(output_lines.get_nowait(), nl=False)
 
-            if result.returncode == 0:
-                click.echo(f"Successfully synced: {file_path}")
-            else:
-                click.echo(f"Error syncing {file_path}: {result.stderr}")
-        except Exception as e:
-            click.echo(f"Error executing rsync: {str(e)}")
+
+def is_remote_rsync_path(path):
+    """Return True if rsync would treat ``path`` as a remote ``host:path``."""
+    host, sep, _ = path.partition(":")
+    return bool(sep) and "/" not in host
 
 
 def get_cache_path():
@@ -628,12 +913,34 @@ def get_cache_path():
     return cache_dir / "last_sync.json"
 
 
-def save_synced_files(file_paths):
-    """Save the list of synced files to a cache file."""
+def _dump_cache(data):
+    """Serialize cache data to bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _load_cache(raw):
+    """Parse cache bytes written by ``_dump_cache``."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def save_synced_files(file_paths, shows=None, sizes=None):
+    """Save the list of synced files to a cache file.
+
+    ``shows`` optionally holds the per-show episode cache built by
+    ``collect_sync_files`` and ``sizes`` the file sizes by path. The file is
+    written to a temporary path and then moved into place so an interrupted
+    write never leaves a torn cache.
+    """
     cache_path = get_cache_path()
+    tmp_path = cache_path.with_suffix(".tmp")
+    data = {"files": file_paths, "sizes": sizes or {}, "shows": shows or {}}
     try:
-        with open(cache_path, "w") as f:
-            json.dump({"files": file_paths}, f)
+        tmp_path.write_bytes(_dump_cache(data))
+        os.replace(tmp_path, cache_path)
         click.echo(f"Saved {len(file_paths)} file paths to {cache_path}")
         return True
     except Exception as e:
@@ -641,17 +948,53 @@ def save_synced_files(file_paths):
         return False
 
 
+def load_show_cache():
+    """Load the per-show episode cache, dropping entries older than SHOW_CACHE_MAX_AGE."""
+    cache_path = get_cache_path()
+    try:
+        shows = _load_cache(cache_path.read_bytes()).get("shows", {})
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        click.echo(f"Error loading show cache: {str(e)}")
+        return {}
+
+    cutoff = time.time() - SHOW_CACHE_MAX_AGE
+    return {
+        key: entry for key, entry in shows.items() if entry.get("cachedAt", 0) >= cutoff
+    }
+
+
+def load_synced_file_sizes():
+    """Load the file sizes saved alongside the synced file list."""
+    cache_path = get_cache_path()
+    try:
+        return _load_cache(cache_path.read_bytes()).get("sizes", {})
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        click.echo(f"Error loading synced file sizes: {str(e)}")
+        return {}
+
+
+def show_cache_fingerprint(show, episode_limit):
+    """Describe the show state that a per-show cache entry is valid for.
+
+    Watching an episode changes ``viewedLeafCount`` without necessarily
+    touching ``updatedAt``, so both are part of the fingerprint.
+    """
+    updated_at = show.updatedAt.isoformat() if show.updatedAt else None
+    return [updated_at, show.leafCount, show.viewedLeafCount, episode_limit]
+
+
 def load_synced_files():
     """Load the list of previously synced files from the cache file."""
     cache_path = get_cache_path()
-    if not cache_path.exists():
+    try:
+        return _load_cache(cache_path.read_bytes()).get("files", [])
+    except FileNotFoundError:
         click.echo(f"Cache file not found: {cache_path}")
         return []
-
-    try:
-        with open(cache_path, "r") as f:
-            data = json.load(f)
-            return data.get("files", [])
     except Exception as e:
         click.echo(f"Error loading synced files: {str(e)}")
         return []
@@ -1,157 +1,18 @@
 import click
-from plexapi.server import PlexServer
-from plexapi.exceptions import Unauthorized
 from . import config
-from .radarr import RadarrClient
+import heapq
 import sys
-from textual.app import App, ComposeResult
-from textual.widgets import DataTable, Footer, Header
-from textual.containers import Container
-from textual.binding import Binding
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+BYTES_PER_GB = 1024**3
+MS_PER_MINUTE = 60 * 1000
 
-class MovieSizeApp(App):
-    """Textual app for displaying movie size table."""
+# Movies per page when listing a library
+SEARCH_PAGE_SIZE = 500
 
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-
-    DataTable {
-        height: 1fr;
-    }
-    """
-
-    BINDINGS = [
-        Binding("space", "toggle_select", "Select/Deselect", show=True),
-        Binding("d", "delete_selected", "Delete Selected", show=True),
-        Binding("q", "quit", "Quit", show=True),
-    ]
-
-    def __init__(self, movies_data, radarr_client=None):
-        super().__init__()
-        self.movies_data = movies_data
-        self.radarr_client = radarr_client
-        self.selected_rows = set()
-        self.row_to_movie = {}  # Maps row index to movie object
-
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Container(
-            DataTable(id="movie_table")
-        )
-        yield Footer()
-
-    def on_mount(self) -> None:
-        table = self.query_one("#movie_table", DataTable)
-        table.cursor_type = "row"
-
-        # Add columns
-        table.add_columns("✓", "Rank", "Library", "Movie", "Duration", "Size (GB)", "GB/min", "Rating", "Audience")
-
-        # Store the data with sortable values
-        for i, (movie, size_bytes) in enumerate(self.movies_data, 1):
-            size_gb = size_bytes / (1024**3)
-            library_name = (
-                movie.section().title
-                if hasattr(movie, "section") and movie.section()
-                else "Unknown"
-            )
-
-            # Format duration (milliseconds to hours:minutes)
-            duration_display = ""
-            duration_minutes = 0
-            if hasattr(movie, 'duration') and movie.duration:
-                hours = movie.duration // (1000 * 60 * 60)
-                minutes = (movie.duration % (1000 * 60 * 60)) // (1000 * 60)
-                duration_display = f"{hours}h {minutes:02d}m"
-                duration_minutes = movie.duration / (1000 * 60)
-
-            # Calculate GB per minute
-            gb_per_min_display = ""
-            gb_per_min_value = 0
-            if duration_minutes > 0:
-                gb_per_min_value = size_gb / duration_minutes
-                gb_per_min_display = f"{gb_per_min_value:.3f}"
-
-            movie_title = f"{movie.title} ({movie.year})" if movie.year else movie.title
-
-            # Get ratings
-            critic_rating = ""
-            if hasattr(movie, 'rating') and movie.rating:
-                critic_rating = f"{movie.rating:.1f}"
-
-            audience_rating = ""
-            if hasattr(movie, 'audienceRating') and movie.audienceRating:
-                audience_rating = f"{movie.audienceRating:.1f}"
-
-            # Add row with zero-padded numeric values for proper sorting
-            row_key = table.add_row(
-                " ",  # Checkbox column
-                f"{i:03d}",
-                library_name,
-                movie_title,
-                duration_display or "   0h 00m",
-                f"{size_gb:.2f}",
-                gb_per_min_display or "0.000",
-                critic_rating or "N/A",
-                audience_rating or "N/A"
-            )
-            # Store movie reference for this row
-            self.row_to_movie[row_key] = movie
-
-    def action_toggle_select(self) -> None:
-        """Toggle selection of the current row."""
-        table = self.query_one("#movie_table", DataTable)
-        if table.cursor_row is not None:
-            row_index = table.cursor_row
-            # Get the actual row key from the ordered rows
-            row_keys = list(table.rows.keys())
-            # Get column key for the checkbox column (first column)
-            column_keys = list(table.columns.keys())
-
-            if row_index < len(row_keys) and len(column_keys) > 0:
-                row_key = row_keys[row_index]
-                checkbox_column_key = column_keys[0]
-
-                if row_key in self.selected_rows:
-                    self.selected_rows.remove(row_key)
-                    # Update the checkbox column (first column)
-                    table.update_cell(row_key, checkbox_column_key, " ")
-                else:
-                    self.selected_rows.add(row_key)
-                    # Update the checkbox column (first column)
-                    table.update_cell(row_key, checkbox_column_key, "✓")
-
-    def action_delete_selected(self) -> None:
-        """Delete selected movies via Radarr API."""
-        if not self.selected_rows:
-            self.notify("No movies selected", severity="warning")
-            return
-
-        if not self.radarr_client:
-            self.notify("Radarr client not configured", severity="error")
-            return
-
-        # Get movie objects for selected rows
-        selected_movies = [self.row_to_movie[row_key] for row_key in self.selected_rows if row_key in self.row_to_movie]
-
-        self.notify(f"Deleting {len(selected_movies)} movies via Radarr...", severity="information")
-
-        for movie in selected_movies:
-            try:
-                success = self.radarr_client.delete_movie(movie)
-                if success:
-                    self.notify(f"Deleted: {movie.title}", severity="success")
-                else:
-                    self.notify(f"Failed to delete: {movie.title}", severity="error")
-            except Exception as e:
-                self.notify(f"Error deleting {movie.title}: {str(e)}", severity="error")
-
-        # Clear selections after deletion
-        self.selected_rows.clear()
-        self.notify("Deletion complete", severity="success")
+# How many of the largest movies (by Plex's sort) to fetch per library for
+# each movie shown; the exact size over all media parts is computed locally
+SEARCH_CANDIDATE_FACTOR = 3
 
 
 @click.command()
@@ -160,7 +21,7 @@ class MovieSizeApp(App):
     "-n",
     default=100,
     type=int,
-    help="Number of movies to show (default: 100)"
+    help="Number of movies to show, 0 for all (default: 100)"
 )
 @click.option(
     "--unwatched",
@@ -169,6 +30,11 @@ class MovieSizeApp(App):
 )
 def cli(limit, unwatched):
     """List largest movies by size (watched by default, use --unwatched for unwatched)."""
+    from plexapi.exceptions import Unauthorized
+
+    if limit < 0:
+        raise click.BadParameter("must be 0 or greater", param_hint="'--limit'")
+
     try:
         server = get_plex_server()
 
@@ -182,6 +48,8 @@ def cli(limit, unwatched):
             radarr_api_key = cfg["radarr"].get("api_key")
 
             if radarr_url and radarr_api_key:
+                from .radarr import RadarrClient
+
                 try:
                     radarr_client = RadarrClient(radarr_url, radarr_api_key)
                     if radarr_client.test_connection():
@@ -205,32 +73,58 @@ def cli(limit, unwatched):
 
         # Collect movies with their sizes based on watch status
         filter_type = "unwatched" if unwatched else "watched"
-        movies_list = []
-
+        # Min-heap of the `limit` largest movies seen so far (all of them
+        # with a limit of 0). The negated
+        # library and scan positions break size ties in favour of earlier
+        # movies whatever order the libraries finish in, and keep Movie
+        # objects from ever being compared
+        heap = []
+
+        # Search every library concurrently and rank each one's movies as
+        # soon as its search finishes, so only the heap outlives a listing;
+        # the exact size ranking stays in this thread
         for section in movie_sections:
             click.echo(f"Scanning library: {section.title} ({filter_type} movies)")
-            for movie in section.all():
-                if movie.isWatched != unwatched and movie.media:
-                    # Get total size in bytes from all media parts
-                    total_size = sum(
-                        part.size
-                        for media in movie.media
-                        for part in media.parts
-                        if hasattr(part, "size")
-                    )
-                    if total_size > 0:
-                        movies_list.append((movie, total_size))
-
-        # Sort by size (largest first) and take top N
-        movies_list.sort(key=lambda x: x[1], reverse=True)
-        top_movies = movies_list[:limit]
+        with ThreadPoolExecutor(max_workers=len(movie_sections)) as executor:
+            futures = {
+                executor.submit(search_movies_by_size, section, unwatched, limit): section_index
+                for section_index, section in enumerate(movie_sections)
+            }
+            for future in as_completed(futures):
+                section_index = futures.pop(future)
+                library_name = movie_sections[section_index].title
+                for movie_index, movie in enumerate(future.result()):
+                    if movie.media:
+                        # Get total size in bytes from all media parts
+                        total_size = sum(
+                            getattr(part, "size", 0) or 0
+                            for media in movie.media
+                            for part in media.parts
+                        )
+                        if total_size > 0:
+                            entry = (total_size, -section_index, -movie_index, movie, library_name)
+                            if limit == 0 or len(heap) < limit:
+                                heapq.heappush(heap, entry)
+                            else:
+                                heapq.heappushpop(heap, entry)
+
+        # Largest first
+        top_movies = [
+            (movie, total_size, library_name)
+            for total_size, _, _, movie, library_name in sorted(heap, reverse=True)
+        ]
 
         if not top_movies:
             click.echo(f"No {filter_type} movies with size information found.")
             return
 
+        # Format the rows before starting the UI so first paint isn't held up
+        rows = format_movie_rows(top_movies)
+
         # Run Textual app with Radarr client if available
-        app = MovieSizeApp(top_movies, radarr_client=radarr_client)
+        from .tui import MovieSizeApp
+
+        app = MovieSizeApp(top_movies, rows, radarr_client=radarr_client)
         app.run()
 
     except Unauthorized:
@@ -243,8 +137,82 @@ def cli(limit, unwatched):
         sys.exit(1)
 
 
+def format_movie_rows(movies_data):
+    """Format ``(movie, size_bytes, library_name)`` tuples as table rows."""
+    rows = []
+    for i, (movie, size_bytes, library_name) in enumerate(movies_data, 1):
+        size_gb = size_bytes / BYTES_PER_GB
+
+        # Format duration (milliseconds to hours:minutes)
+        duration_display = ""
+        duration_minutes = 0
+        duration = getattr(movie, "duration", None)
+        if duration:
+            duration_minutes = duration / MS_PER_MINUTE
+            hours, minutes = divmod(int(duration_minutes), 60)
+            duration_display = f"{hours}h {minutes:02d}m"
+
+        # Calculate GB per minute
+        gb_per_min_display = ""
+        gb_per_min_value = 0
+        if duration_minutes > 0:
+            gb_per_min_value = size_gb / duration_minutes
+            gb_per_min_display = f"{gb_per_min_value:.3f}"
+
+        year = getattr(movie, "year", None)
+        movie_title = f"{movie.title} ({year})" if year else movie.title
+
+        # Get ratings
+        rating = getattr(movie, "rating", None)
+        critic_rating = f"{rating:.1f}" if rating else ""
+
+        audience = getattr(movie, "audienceRating", None)
+        audience_rating = f"{audience:.1f}" if audience else ""
+
+        # Zero-padded numeric values for proper sorting
+        rows.append((
+            " ",  # Checkbox column
+            f"{i:03d}",
+            library_name,
+            movie_title,
+            duration_display or "   0h 00m",
+            f"{size_gb:.2f}",
+            gb_per_min_display or "0.000",
+            critic_rating or "N/A",
+            audience_rating or "N/A"
+        ))
+
+    return rows
+
+
+def search_movies_by_size(section, unwatched, limit):
+    """Fetch the largest watched or unwatched movies of a section.
+
+    The watch status filter, the size sort and the result limit all run on
+    the Plex server; a ``limit`` of 0 fetches every matching movie. If the
+    server can't sort by size, fall back to every movie matching the watch
+    status.
+    """
+    from plexapi.exceptions import BadRequest, NotFound
+
+    # Only cap the search when a limit was given; 0 means all movies
+    search_limit = {"maxresults": limit * SEARCH_CANDIDATE_FACTOR} if limit > 0 else {}
+
+    try:
+        return section.search(
+            unwatched=unwatched,
+            sort="mediaSize:desc",
+            container_size=SEARCH_PAGE_SIZE,
+            **search_limit,
+        )
+    except (BadRequest, NotFound):
+        return section.search(unwatched=unwatched, container_size=SEARCH_PAGE_SIZE)
+
+
 def get_plex_server():
     """Get a connection to the Plex server."""
+    from plexapi.server import PlexServer
+
     cfg = config.load_config()
     url = cfg["plex"]["url"]
     token = cfg["plex"]["token"]
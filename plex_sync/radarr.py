@@ -1,5 +1,8 @@
 """Radarr API client for managing movies."""
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any
 import click
 
@@ -17,10 +20,25 @@ class RadarrClient:
         self.url = url.rstrip('/')
         self.api_key = api_key
         self.session = requests.Session()
+        # Pool connections for concurrent deletes and retry transient
+        # gateway errors with backoff
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'X-Api-Key': api_key,
             'Content-Type': 'application/json'
         })
+        # Title lookup tables built from the movie list on first lookup and
+        # reused; deletes may look movies up from several threads at once
+        self._movies_index: Optional[tuple] = None
+        self._movies_lock = threading.Lock()
 
     def _get(self, endpoint: str) -> Optional[Any]:
         """Make a GET request to Radarr API."""
@@ -42,6 +60,64 @@ class RadarrClient:
             click.echo(f"Radarr API DELETE error: {str(e)}", err=True)
             return False
 
+    def invalidate_cache(self) -> None:
+        """Drop the cached movie index so the next lookup refetches the list."""
+        with self._movies_lock:
+            self._movies_index = None
+
+    @staticmethod
+    def _index_keys(movie: Dict):
+        """Yield ``(table, key)`` for every index entry of ``movie``.
+
+        ``table`` is the position in the ``_get_movies_index`` tuple.
+        """
+        movie_year = movie.get('year')
+        movie_title = movie.get('title', '').lower().strip()
+        yield 0, (movie_title, movie_year)
+        yield 1, movie_title
+        yield 2, movie_title
+        for alt_title in movie.get('alternateTitles', []):
+            alt = alt_title.get('title', '').lower().strip()
+            yield 0, (alt, movie_year)
+            yield 2, alt
+
+    def _forget_movie(self, movie: Dict) -> None:
+        """Remove a deleted movie from the cached index."""
+        with self._movies_lock:
+            if self._movies_index is None:
+                return
+            for table, key in self._index_keys(movie):
+                candidates = self._movies_index[table].get(key)
+                if candidates and movie in candidates:
+                    candidates.remove(movie)
+                    if not candidates:
+                        del self._movies_index[table][key]
+
+    def _get_movies_index(self) -> Optional[tuple]:
+        """Return the title lookup tables for the Radarr movie list.
+
+        The tables are ``(by_title_year, by_title, by_any_title)``: exact
+        ``(title, year)`` matches including alternate titles, main titles
+        only, and main or alternate titles. Titles are lowercased and
+        stripped. Each key maps to its movies in list order, so the first
+        one wins as in a linear scan and a delete only removes its own
+        entries instead of forcing a rebuild.
+        """
+        with self._movies_lock:
+            if self._movies_index is None:
+                movies = self._get("movie")
+                if movies is None:
+                    return None
+
+                index = ({}, {}, {})
+                for movie in movies:
+                    for table, key in self._index_keys(movie):
+                        candidates = index[table].setdefault(key, [])
+                        if movie not in candidates:
+                            candidates.append(movie)
+                self._movies_index = index
+            return self._movies_index
+
     def find_movie_by_title(self, title: str, year: Optional[int] = None) -> Optional[Dict]:
         """Find a movie in Radarr by title and optionally year.
 
@@ -52,45 +128,23 @@ class RadarrClient:
         Returns:
             Movie object from Radarr if found, None otherwise
         """
-        movies = self._get("movie")
-        if not movies:
+        index = self._get_movies_index()
+        if not index:
             return None
+        by_title_year, by_title, by_any_title = index
 
         # Normalize the search title
         search_title = title.lower().strip()
 
-        for movie in movies:
-            movie_title = movie.get('title', '').lower().strip()
-
-            # Try exact title match
-            if movie_title == search_title:
-                # If year is provided, verify it matches
-                if year:
-                    movie_year = movie.get('year')
-                    if movie_year == year:
-                        return movie
-                else:
-                    return movie
-
-            # Try alternative titles
-            alternative_titles = movie.get('alternateTitles', [])
-            for alt_title in alternative_titles:
-                if alt_title.get('title', '').lower().strip() == search_title:
-                    if year:
-                        movie_year = movie.get('year')
-                        if movie_year == year:
-                            return movie
-                    else:
-                        return movie
-
-        # If no exact match found and year is provided, try title-only match
-        if year:
-            for movie in movies:
-                movie_title = movie.get('title', '').lower().strip()
-                if movie_title == search_title:
-                    return movie
-
-        return None
+        if not year:
+            # Any exact title or alternative title match
+            candidates = by_any_title.get(search_title)
+        else:
+            # Exact title (or alternative title) and year match, else fall
+            # back to a title-only match
+            candidates = by_title_year.get((search_title, year)) or by_title.get(search_title)
+
+        return candidates[0] if candidates else None
 
     def delete_movie(self, plex_movie, delete_files: bool = True, add_exclusion: bool = True) -> bool:
         """Delete a movie from Radarr.
@@ -125,6 +179,8 @@ class RadarrClient:
         success = self._delete(f"movie/{movie_id}", params=params)
 
         if success:
+            # Keep the cached index in step without refetching the catalog
+            self._forget_movie(radarr_movie)
             click.echo(f"Successfully deleted '{title}' from Radarr (files deleted: {delete_files}, exclusion added: {add_exclusion})")
         else:
             click.echo(f"Failed to delete '{title}' from Radarr", err=True)
@@ -1,210 +1,46 @@
 import click
-from plexapi.server import PlexServer
-from plexapi.exceptions import Unauthorized
 from . import config
-from .sonarr import SonarrClient
+import gc
+import heapq
+import json
+import sqlite3
 import sys
-from textual.app import App, ComposeResult
-from textual.widgets import DataTable, Footer, Header
-from textual.containers import Container
-from textual.binding import Binding
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
 
+# Episodes per page when listing a library
+SEARCH_PAGE_SIZE = 500
 
-class ShowSizeApp(App):
-    """Textual app for displaying TV show size table."""
+# Changed shows whose episodes are listed with one search
+SHOW_ID_BATCH_SIZE = 50
 
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-
-    DataTable {
-        height: 1fr;
-    }
-    """
-
-    BINDINGS = [
-        Binding("space", "toggle_select", "Select/Deselect", show=True),
-        Binding("d", "delete_selected", "Delete Selected", show=True),
-        Binding("s", "toggle_view", "Toggle Season/Show View", show=True),
-        Binding("q", "quit", "Quit", show=True),
-    ]
-
-    def __init__(self, shows_data, sonarr_client=None):
-        super().__init__()
-        self.shows_data = shows_data
-        self.sonarr_client = sonarr_client
-        self.selected_rows = set()
-        self.row_to_show = {}  # Maps row index to show object
-        self.view_mode = "show"  # "show" or "season"
-
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Container(
-            DataTable(id="show_table")
-        )
-        yield Footer()
-
-    def on_mount(self) -> None:
-        table = self.query_one("#show_table", DataTable)
-        table.cursor_type = "row"
-
-        # Populate the table (this adds columns and data)
-        self.populate_table()
+# Refetch cached show sizes after 30 days even if the show looks unchanged
+SIZE_CACHE_MAX_AGE = 30 * 24 * 60 * 60
 
-    def populate_table(self):
-        """Populate the table with shows/seasons data."""
-        table = self.query_one("#show_table", DataTable)
-        table.clear(columns=True)  # Clear both rows and columns
-        self.row_to_show.clear()
-        self.selected_rows.clear()
 
-        # Add columns based on view mode
-        if self.view_mode == "show":
-            table.add_columns("✓", "Rank", "Library", "Show", "Episodes", "Size (GB)", "GB/ep", "Rating", "Audience")
-        else:  # season view
-            table.add_columns("✓", "Rank", "Library", "Show - Season", "Episodes", "Size (GB)", "GB/ep")
-
-        # Build display list based on view mode
-        display_items = []
-
-        for show, size_bytes, episode_count, season_data in self.shows_data:
-            if self.view_mode == "show":
-                display_items.append((show, size_bytes, episode_count, None, season_data))
-            else:  # season mode
-                for season_num, (season_size, season_ep_count) in season_data.items():
-                    display_items.append((show, season_size, season_ep_count, season_num, season_data))
-
-        # Sort by size
-        display_items.sort(key=lambda x: x[1], reverse=True)
-
-        # Add rows to table
-        row_key = 0
-        for i, (show, size_bytes, episode_count, season_num, season_data) in enumerate(display_items, 1):
-            size_gb = size_bytes / (1024**3)
-            library_name = (
-                show.section().title
-                if hasattr(show, "section") and show.section()
-                else "Unknown"
-            )
+@dataclass(slots=True)
+class ShowRow:
+    """A scanned show with the fields the size table displays.
 
-            # Calculate GB per episode
-            gb_per_episode_display = ""
-            if episode_count > 0:
-                gb_per_episode = size_gb / episode_count
-                gb_per_episode_display = f"{gb_per_episode:.3f}"
-
-            if self.view_mode == "show":
-                show_title = f"{show.title} ({show.year})" if hasattr(show, 'year') and show.year else show.title
-
-                # Get ratings
-                critic_rating = ""
-                if hasattr(show, 'rating') and show.rating:
-                    critic_rating = f"{show.rating:.1f}"
-
-                audience_rating = ""
-                if hasattr(show, 'audienceRating') and show.audienceRating:
-                    audience_rating = f"{show.audienceRating:.1f}"
-
-                # Add row with zero-padded numeric values for proper sorting
-                table.add_row(
-                    " ",  # Checkbox column
-                    f"{i:03d}",
-                    library_name,
-                    show_title,
-                    f"{episode_count:04d}",
-                    f"{size_gb:.2f}",
-                    gb_per_episode_display or "0.000",
-                    critic_rating or "N/A",
-                    audience_rating or "N/A"
-                )
-            else:  # season view
-                # Handle None season numbers (specials/extras)
-                if season_num is None:
-                    show_title = f"{show.title} - Specials"
-                else:
-                    show_title = f"{show.title} - S{season_num:02d}"
-                table.add_row(
-                    " ",  # Checkbox column
-                    f"{i:03d}",
-                    library_name,
-                    show_title,
-                    f"{episode_count:04d}",
-                    f"{size_gb:.2f}",
-                    gb_per_episode_display or "0.000"
-                )
-
-            # Store show reference for this row
-            self.row_to_show[row_key] = (show, season_num)
-            row_key += 1
-
-    def action_toggle_select(self) -> None:
-        """Toggle selection of the current row."""
-        table = self.query_one("#show_table", DataTable)
-        if table.cursor_row is not None:
-            row_index = table.cursor_row
-            # Get the actual row key from the ordered rows
-            row_keys = list(table.rows.keys())
-            # Get column key for the checkbox column (first column)
-            column_keys = list(table.columns.keys())
-
-            if row_index < len(row_keys) and len(column_keys) > 0:
-                row_key = row_keys[row_index]
-                checkbox_column_key = column_keys[0]
-
-                if row_key in self.selected_rows:
-                    self.selected_rows.remove(row_key)
-                    # Update the checkbox column (first column)
-                    table.update_cell(row_key, checkbox_column_key, " ")
-                else:
-                    self.selected_rows.add(row_key)
-                    # Update the checkbox column (first column)
-                    table.update_cell(row_key, checkbox_column_key, "✓")
-
-    def action_delete_selected(self) -> None:
-        """Delete selected TV shows via Sonarr API."""
-        if not self.selected_rows:
-            self.notify("No shows selected", severity="warning")
-            return
-
-        if not self.sonarr_client:
-            self.notify("Sonarr client not configured", severity="error")
-            return
-
-        # Get show objects for selected rows (only shows, not individual seasons)
-        selected_shows = []
-        for row_key in self.selected_rows:
-            if row_key in self.row_to_show:
-                show, season_num = self.row_to_show[row_key]
-                # Only delete entire shows, not individual seasons
-                if show not in selected_shows:
-                    selected_shows.append(show)
-
-        if not selected_shows:
-            self.notify("No shows selected", severity="warning")
-            return
-
-        self.notify(f"Deleting {len(selected_shows)} shows via Sonarr...", severity="information")
-
-        for show in selected_shows:
-            try:
-                success = self.sonarr_client.delete_series(show)
-                if success:
-                    self.notify(f"Deleted: {show.title}", severity="success")
-                else:
-                    self.notify(f"Failed to delete: {show.title}", severity="error")
-            except Exception as e:
-                self.notify(f"Error deleting {show.title}: {str(e)}", severity="error")
-
-        # Clear selections after deletion
-        self.selected_rows.clear()
-        self.notify("Deletion complete", severity="success")
+    The fields are read off the plexapi object once during the scan, and
+    the object itself is not kept; ``title`` and ``year`` are all Sonarr
+    needs to delete the show. ``seasons`` maps season numbers to
+    ``(size, episode_count)``.
+    """
 
-    def action_toggle_view(self) -> None:
-        """Toggle between show view and season view."""
-        self.view_mode = "season" if self.view_mode == "show" else "show"
-        self.populate_table()
-        self.notify(f"Switched to {self.view_mode} view")
+    rating_key: int
+    title: str
+    year: int | None
+    library: str
+    rating: float | None
+    audience: float | None
+    size: int
+    episodes: int
+    seasons: dict
 
 
 @click.command()
@@ -213,7 +49,7 @@ class ShowSizeApp(App):
     "-n",
     default=100,
     type=int,
-    help="Number of shows to show (default: 100)"
+    help="Number of shows to show, 0 for all (default: 100)"
 )
 @click.option(
     "--watched",
@@ -222,8 +58,16 @@ class ShowSizeApp(App):
 )
 def cli(limit, watched):
     """List largest TV shows by size."""
+    import requests
+    from plexapi.exceptions import Unauthorized
+
+    if limit < 0:
+        raise click.BadParameter("must be 0 or greater", param_hint="'--limit'")
+
     try:
-        server = get_plex_server()
+        # Owned here so it can be closed once the scan is done
+        session = requests.Session()
+        server = get_plex_server(session)
 
         # Load config to check for Sonarr settings
         cfg = config.load_config()
@@ -235,6 +79,8 @@ def cli(limit, watched):
             sonarr_api_key = cfg["sonarr"].get("api_key")
 
             if sonarr_url and sonarr_api_key:
+                from .sonarr import SonarrClient
+
                 try:
                     sonarr_client = SonarrClient(sonarr_url, sonarr_api_key)
                     if sonarr_client.test_connection():
@@ -256,70 +102,51 @@ def cli(limit, watched):
             click.echo("No TV show libraries found.")
             return
 
-        # Collect shows with their sizes
+        # Collect shows with their sizes, reusing sizes of unchanged shows
         shows_list = []
+        cached_sizes = load_size_cache()
+        new_sizes = {}
 
+        # Scan every library concurrently and merge the results in order
         for section in show_sections:
             click.echo(f"Scanning library: {section.title}")
-            for show in section.all():
-                episodes = show.episodes()
-
-                # Filter based on watched flag
-                if watched:
-                    # Only include shows where ALL episodes are watched
-                    if not all(ep.isWatched for ep in episodes):
-                        continue
-
-                if episodes:
-                    # Get total size and per-season breakdown
-                    total_size = 0
-                    total_episode_count = 0
-                    season_data = {}
-
-                    try:
-                        for season in show.seasons():
-                            season_size = 0
-                            season_ep_count = 0
-                            for episode in season.episodes():
-                                if episode.media:
-                                    episode_size = sum(
-                                        part.size
-                                        for media in episode.media
-                                        for part in media.parts
-                                        if hasattr(part, "size")
-                                    )
-                                    season_size += episode_size
-                                    season_ep_count += 1
-
-                            if season_size > 0:
-                                season_data[season.seasonNumber] = (season_size, season_ep_count)
-                                total_size += season_size
-                                total_episode_count += season_ep_count
-                    except AttributeError:
-                        # Fallback for shows without proper season structure
-                        for episode in episodes:
-                            if episode.media:
-                                total_size += sum(
-                                    part.size
-                                    for media in episode.media
-                                    for part in media.parts
-                                    if hasattr(part, "size")
-                                )
-                        total_episode_count = len(episodes)
-
-                    if total_size > 0:
-                        shows_list.append((show, total_size, total_episode_count, season_data))
-
-        # Sort by size (largest first) and take top N
-        shows_list.sort(key=lambda x: x[1], reverse=True)
-        top_shows = shows_list[:limit]
+        try:
+            with ThreadPoolExecutor(max_workers=len(show_sections)) as executor:
+                for section_shows, section_sizes in executor.map(
+                    lambda s: scan_show_sizes(s, watched, cached_sizes), show_sections
+                ):
+                    shows_list.extend(section_shows)
+                    new_sizes.update(section_sizes)
+        finally:
+            # The table only needs the scanned ShowRows; release the pooled
+            # Plex connections instead of holding them open while it runs
+            session.close()
+
+        if new_sizes:
+            save_size_cache(new_sizes)
+
+        # Take the top N by size (largest first) without sorting everything
+        if limit > 0:
+            top_shows = heapq.nlargest(limit, shows_list, key=lambda row: row.size)
+        else:
+            top_shows = sorted(shows_list, key=lambda row: row.size, reverse=True)
 
         if not top_shows:
             click.echo("No TV shows with size information found.")
             return
 
+        # Format both views before starting the UI, so neither the first
+        # paint nor toggling views has to build rows on the event loop
+        views = {mode: format_show_rows(top_shows, mode) for mode in ("show", "season")}
+
+        # Drop the plexapi objects from the scan before the long-lived UI
+        server = show_sections = shows_list = top_shows = None
+        gc.collect()
+
         # Run Textual app with Sonarr client if available
-        app = ShowSizeApp(top_shows, sonarr_client=sonarr_client)
+        from .tui import ShowSizeApp
+
+        app = ShowSizeApp(views, sonarr_client=sonarr_client)
         app.run()
 
     except Unauthorized:
@@ -332,8 +159,345 @@ def cli(limit, watched):
         sys.exit(1)
 
 
-def get_plex_server():
-    """Get a connection to the Plex server."""
+def format_show_rows(shows_data, view_mode):
+    """Format scanned ``ShowRow`` entries as table rows for ``view_mode``.
+
+    Returns ``(rows, targets)`` where ``targets[i]`` is the
+    ``(show_row, season_num)`` behind ``rows[i]``; ``season_num`` is None
+    in show view.
+    """
+    # Build display list based on view mode
+    display_items = []
+
+    for show_row in shows_data:
+        if view_mode == "show":
+            display_items.append((show_row, show_row.size, show_row.episodes, None))
+        else:  # season mode
+            for season_num, (season_size, season_ep_count) in show_row.seasons.items():
+                display_items.append((show_row, season_size, season_ep_count, season_num))
+
+    # Shows arrive sorted by size; seasons of different shows need sorting
+    if view_mode == "season":
+        display_items.sort(key=lambda x: x[1], reverse=True)
+
+    rows = []
+    targets = []
+    for i, (show_row, size_bytes, episode_count, season_num) in enumerate(display_items, 1):
+        size_gb = size_bytes / (1024**3)
+        library_name = show_row.library
+
+        # Calculate GB per episode
+        gb_per_episode_display = ""
+        if episode_count > 0:
+            gb_per_episode = size_gb / episode_count
+            gb_per_episode_display = f"{gb_per_episode:.3f}"
+
+        if view_mode == "show":
+            show_title = f"{show_row.title} ({show_row.year})" if show_row.year else show_row.title
+
+            # Get ratings
+            critic_rating = f"{show_row.rating:.1f}" if show_row.rating else ""
+            audience_rating = f"{show_row.audience:.1f}" if show_row.audience else ""
+
+            # Zero-padded numeric values for proper sorting
+            rows.append((
+                " ",  # Checkbox column
+                f"{i:03d}",
+                library_name,
+                show_title,
+                f"{episode_count:04d}",
+                f"{size_gb:.2f}",
+                gb_per_episode_display or "0.000",
+                critic_rating or "N/A",
+                audience_rating or "N/A"
+            ))
+        else:  # season view
+            # Handle None season numbers (specials/extras)
+            if season_num is None:
+                show_title = f"{show_row.title} - Specials"
+            else:
+                show_title = f"{show_row.title} - S{season_num:02d}"
+            rows.append((
+                " ",  # Checkbox column
+                f"{i:03d}",
+                library_name,
+                show_title,
+                f"{episode_count:04d}",
+                f"{size_gb:.2f}",
+                gb_per_episode_display or "0.000"
+            ))
+
+        targets.append((show_row, season_num))
+
+    return rows, targets
+
+
+def get_size_cache_path():
+    """Get the path to the show size cache database."""
+    config_path = config.get_config_path()
+    if config_path:
+        cache_dir = config_path.parent
+    else:
+        # Use default cache location
+        cache_dir = Path.home() / ".cache" / "plex-sync"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    return cache_dir / "show_sizes.db"
+
+
+def _open_size_cache():
+    """Open the size cache database, creating its table when missing."""
+    conn = sqlite3.connect(get_size_cache_path())
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS sizes ("
+        "rating_key INTEGER PRIMARY KEY, section_id INTEGER, updated_at INTEGER, "
+        "leaf_count INTEGER, size_bytes INTEGER, episode_count INTEGER, "
+        "seasons TEXT, cached_at REAL)"
+    )
+    return conn
+
+
+def load_size_cache():
+    """Load cached show sizes by ratingKey, skipping entries older than SIZE_CACHE_MAX_AGE."""
+    cutoff = time.time() - SIZE_CACHE_MAX_AGE
+    try:
+        with closing(_open_size_cache()) as conn:
+            rows = conn.execute(
+                "SELECT rating_key, section_id, updated_at, leaf_count, size_bytes, "
+                "episode_count, seasons FROM sizes WHERE cached_at >= ?",
+                (cutoff,),
+            ).fetchall()
+    except (sqlite3.Error, OSError) as e:
+        click.echo(f"Error loading show size cache: {str(e)}", err=True)
+        return {}
+
+    return {
+        rating_key: {
+            "section_id": section_id,
+            "updated_at": updated_at,
+            "leaf_count": leaf_count,
+            "size": size_bytes,
+            "episodes": episode_count,
+            "seasons": {
+                season_num: (season_size, season_ep_count)
+                for season_num, season_size, season_ep_count in json.loads(seasons)
+            },
+        }
+        for rating_key, section_id, updated_at, leaf_count, size_bytes, episode_count, seasons in rows
+    }
+
+
+def save_size_cache(entries):
+    """Store freshly measured show sizes and drop expired entries."""
+    now = time.time()
+    try:
+        with closing(_open_size_cache()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sizes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        rating_key,
+                        entry["section_id"],
+                        entry["updated_at"],
+                        entry["leaf_count"],
+                        entry["size"],
+                        entry["episodes"],
+                        json.dumps([
+                            [season_num, season_size, season_ep_count]
+                            for season_num, (season_size, season_ep_count) in entry["seasons"].items()
+                        ]),
+                        now,
+                    )
+                    for rating_key, entry in entries.items()
+                ],
+            )
+            conn.execute(
+                "DELETE FROM sizes WHERE cached_at < ?", (now - SIZE_CACHE_MAX_AGE,)
+            )
+    except (sqlite3.Error, OSError) as e:
+        click.echo(f"Error saving show size cache: {str(e)}", err=True)
+
+
+def forget_cached_sizes(rating_keys):
+    """Drop cached sizes for shows that were deleted."""
+    try:
+        with closing(_open_size_cache()) as conn, conn:
+            conn.executemany(
+                "DELETE FROM sizes WHERE rating_key = ?",
+                [(rating_key,) for rating_key in rating_keys],
+            )
+    except (sqlite3.Error, OSError) as e:
+        click.echo(f"Error updating show size cache: {str(e)}", err=True)
+
+
+def list_shows(section, watched):
+    """List a section's shows, only fully watched ones with ``watched``."""
+    from plexapi.exceptions import BadRequest, NotFound
+
+    if watched:
+        try:
+            return section.search(libtype="show", filters={"show.unwatchedLeaves": False})
+        except (BadRequest, NotFound):
+            # The server rejected the filter; leaf counts tell the same
+            return [
+                show for show in section.search(libtype="show")
+                if show.viewedLeafCount >= show.leafCount
+            ]
+
+    return section.search(libtype="show")
+
+
+def list_episodes(section, shows, watched, whole_section):
+    """List the episodes of ``shows``.
+
+    With ``whole_section`` every episode of the section is listed in one
+    paged search, otherwise only those of ``shows``, a batch of shows per
+    search. With ``watched`` unwatched episodes are left out server-side
+    where possible; the shows are fully watched anyway.
+    """
+    from plexapi.exceptions import BadRequest, NotFound
+
+    if not whole_section:
+        episodes = []
+        try:
+            for start in range(0, len(shows), SHOW_ID_BATCH_SIZE):
+                batch = shows[start:start + SHOW_ID_BATCH_SIZE]
+                episodes.extend(section.search(
+                    libtype="episode",
+                    filters={"show.id": [show.ratingKey for show in batch]},
+                    container_size=SEARCH_PAGE_SIZE,
+                ))
+            return episodes
+        except (BadRequest, NotFound):
+            pass
+
+    if watched:
+        try:
+            return section.search(
+                libtype="episode",
+                filters={"episode.unwatched": False},
+                container_size=SEARCH_PAGE_SIZE,
+            )
+        except (BadRequest, NotFound):
+            pass
+
+    return section.search(libtype="episode", container_size=SEARCH_PAGE_SIZE)
+
+
+def size_cache_fingerprint(show):
+    """Describe the show state that a cached size is valid for."""
+    updated_at = int(show.updatedAt.timestamp()) if show.updatedAt else None
+    return updated_at, show.leafCount
+
+
+def measure_shows(section, shows, episodes):
+    """Return size cache entries for ``shows`` from their listed episodes."""
+    episodes_by_show = defaultdict(list)
+    for episode in episodes:
+        episodes_by_show[episode.grandparentRatingKey].append(episode)
+
+    entries = {}
+    for show in shows:
+        # Get per-season breakdown
+        season_totals = defaultdict(lambda: [0, 0])
+        for episode in episodes_by_show.get(show.ratingKey, ()):
+            if episode.media:
+                episode_size = 0
+                for media in episode.media:
+                    for part in media.parts:
+                        episode_size += part.size or 0
+                totals = season_totals[episode.parentIndex]
+                totals[0] += episode_size
+                totals[1] += 1
+
+        # Seasons in order, like show.seasons() returns them
+        season_data = {
+            season_num: (season_size, season_ep_count)
+            for season_num, (season_size, season_ep_count) in sorted(
+                season_totals.items(), key=lambda item: (item[0] is None, item[0] or 0)
+            )
+            if season_size > 0
+        }
+
+        updated_at, leaf_count = size_cache_fingerprint(show)
+        entries[show.ratingKey] = {
+            "section_id": section.key,
+            "updated_at": updated_at,
+            "leaf_count": leaf_count,
+            "size": sum(size for size, _ in season_data.values()),
+            "episodes": sum(count for _, count in season_data.values()),
+            "seasons": season_data,
+        }
+
+    return entries
+
+
+def scan_show_sizes(section, watched, cached_sizes=None):
+    """Return ``(rows, new_entries)`` for a section.
+
+    ``rows`` holds a ``ShowRow`` for every show with media. Sizes come from
+    ``cached_sizes`` (size cache entries by ratingKey) for shows whose
+    ``updatedAt`` and ``leafCount`` still match, so only changed shows have
+    their episodes listed; ``new_entries`` holds the entries measured for
+    those. When most shows changed, all episodes of the section are fetched
+    with one paged search and grouped by show in memory instead, and when
+    nothing of the section is cached that search runs alongside the show
+    listing. With ``watched`` only fully watched shows are returned.
+    """
+    cached_sizes = cached_sizes or {}
+
+    if not any(entry["section_id"] == section.key for entry in cached_sizes.values()):
+        # Nothing cached for this section, so every show needs measuring:
+        # list all episodes alongside the shows as an uncached scan does
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            shows_future = executor.submit(list_shows, section, watched)
+            episodes = list_episodes(section, (), watched, whole_section=True)
+            shows = shows_future.result()
+        new_entries = measure_shows(section, shows, episodes)
+        sizes = dict(new_entries)
+    else:
+        shows = list_shows(section, watched)
+
+        sizes = {}
+        stale = []
+        for show in shows:
+            entry = cached_sizes.get(show.ratingKey)
+            if entry and (entry["updated_at"], entry["leaf_count"]) == size_cache_fingerprint(show):
+                sizes[show.ratingKey] = entry
+            else:
+                stale.append(show)
+
+        new_entries = {}
+        if stale:
+            episodes = list_episodes(
+                section, stale, watched, whole_section=len(stale) * 2 > len(shows)
+            )
+            new_entries = measure_shows(section, stale, episodes)
+            sizes.update(new_entries)
+
+    results = []
+    for show in shows:
+        entry = sizes[show.ratingKey]
+        if entry["size"] > 0:
+            results.append(ShowRow(
+                rating_key=show.ratingKey,
+                title=show.title,
+                year=getattr(show, "year", None),
+                library=section.title,
+                rating=getattr(show, "rating", None),
+                audience=getattr(show, "audienceRating", None),
+                size=entry["size"],
+                episodes=entry["episodes"],
+                seasons=entry["seasons"],
+            ))
+
+    return results, new_entries
+
+
+def get_plex_server(session=None):
+    """Get a connection to the Plex server, using ``session`` for its requests."""
+    from plexapi.server import PlexServer
+
     cfg = config.load_config()
     url = cfg["plex"]["url"]
     token = cfg["plex"]["token"]
@@ -343,4 +507,4 @@ def get_plex_server():
             "Plex token not configured. Run 'plex-sync config' to create a config file."
         )
 
-    return PlexServer(url, token)
+    return PlexServer(url, token, session=session)
@@ -1,8 +1,24 @@
 """Sonarr API client for managing TV shows."""
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any
 import click
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# Most DELETE requests sent to Sonarr per second; deletes also queue disk
+# work in Sonarr, so bursts are spread out instead of sent at once
+DELETES_PER_SECOND = 4
+
+# Seconds a successful system/status response is reused
+STATUS_CACHE_TTL = 60
+
 
 class SonarrClient:
     """Client for interacting with Sonarr API."""
@@ -17,31 +33,123 @@ class SonarrClient:
         self.url = url.rstrip('/')
         self.api_key = api_key
         self.session = requests.Session()
+        # One host, so one pool; keep its connections alive between requests
+        # and retry rate limits and transient server errors with backoff
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+            ),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'X-Api-Key': api_key,
             'Content-Type': 'application/json'
         })
+        # Title lookup tables built from the series list on first lookup
+        # and reused
+        self._series_index: Optional[tuple] = None
+        self._series_lock = threading.Lock()
+        # Last successful system/status response and when it was fetched
+        self._status: Optional[Dict] = None
+        self._status_fetched = 0.0
+        # Earliest time the next DELETE may be sent
+        self._next_delete = 0.0
+        self._delete_lock = threading.Lock()
 
     def _get(self, endpoint: str) -> Optional[Any]:
         """Make a GET request to Sonarr API."""
         try:
             response = self.session.get(f"{self.url}/api/v3/{endpoint}")
             response.raise_for_status()
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             click.echo(f"Sonarr API GET error: {str(e)}", err=True)
             return None
 
-    def _delete(self, endpoint: str, params: Optional[Dict] = None) -> bool:
+    def _delete(self, endpoint: str, params: Optional[Dict] = None, json: Optional[Any] = None) -> bool:
         """Make a DELETE request to Sonarr API."""
+        self._wait_for_delete_slot()
         try:
-            response = self.session.delete(f"{self.url}/api/v3/{endpoint}", params=params)
+            response = self.session.delete(f"{self.url}/api/v3/{endpoint}", params=params, json=json)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
             click.echo(f"Sonarr API DELETE error: {str(e)}", err=True)
             return False
 
+    def _wait_for_delete_slot(self) -> None:
+        """Block until sending another DELETE stays within DELETES_PER_SECOND."""
+        with self._delete_lock:
+            now = time.monotonic()
+            wait = self._next_delete - now
+            self._next_delete = max(now, self._next_delete) + 1 / DELETES_PER_SECOND
+        if wait > 0:
+            time.sleep(wait)
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached series index so the next lookup refetches the list."""
+        with self._series_lock:
+            self._series_index = None
+
+    @staticmethod
+    def _index_keys(series: Dict):
+        """Yield ``(table, key)`` for every index entry of ``series``.
+
+        ``table`` is the position in the ``_get_series_index`` tuple.
+        """
+        series_year = series.get('year')
+        series_title = series.get('title', '').lower().strip()
+        yield 0, (series_title, series_year)
+        yield 1, series_title
+        yield 2, series_title
+        for alt_title in series.get('alternateTitles', []):
+            alt = alt_title.get('title', '').lower().strip()
+            yield 0, (alt, series_year)
+            yield 2, alt
+
+    def _forget_series(self, deleted) -> None:
+        """Remove deleted series from the cached index."""
+        with self._series_lock:
+            if self._series_index is None:
+                return
+            for series in deleted:
+                for table, key in self._index_keys(series):
+                    candidates = self._series_index[table].get(key)
+                    if candidates and series in candidates:
+                        candidates.remove(series)
+                        if not candidates:
+                            del self._series_index[table][key]
+
+    def _get_series_index(self) -> Optional[tuple]:
+        """Return the title lookup tables for the Sonarr series list.
+
+        The tables are ``(by_title_year, by_title, by_any_title)``: exact
+        ``(title, year)`` matches including alternate titles, main titles
+        only, and main or alternate titles. Titles are lowercased and
+        stripped. Each key maps to its series in list order, so the first
+        one wins as in a linear scan and a delete only removes its own
+        entries instead of forcing a rebuild.
+        """
+        with self._series_lock:
+            if self._series_index is None:
+                series_list = self._get("series")
+                if series_list is None:
+                    return None
+
+                index = ({}, {}, {})
+                for series in series_list:
+                    for table, key in self._index_keys(series):
+                        candidates = index[table].setdefault(key, [])
+                        if series not in candidates:
+                            candidates.append(series)
+                self._series_index = index
+            return self._series_index
+
     def find_series_by_title(self, title: str, year: Optional[int] = None) -> Optional[Dict]:
         """Find a TV series in Sonarr by title and optionally year.
 
@@ -52,45 +160,23 @@ class SonarrClient:
         Returns:
             Series object from Sonarr if found, None otherwise
         """
-        series_list = self._get("series")
-        if not series_list:
+        index = self._get_series_index()
+        if not index:
             return None
+        by_title_year, by_title, by_any_title = index
 
         # Normalize the search title
         search_title = title.lower().strip()
 
-        for series in series_list:
-            series_title = series.get('title', '').lower().strip()
-
-            # Try exact title match
-            if series_title == search_title:
-                # If year is provided, verify it matches
-                if year:
-                    series_year = series.get('year')
-                    if series_year == year:
-                        return series
-                else:
-                    return series
-
-            # Try alternative titles
-            alternative_titles = series.get('alternateTitles', [])
-            for alt_title in alternative_titles:
-                if alt_title.get('title', '').lower().strip() == search_title:
-                    if year:
-                        series_year = series.get('year')
-                        if series_year == year:
-                            return series
-                    else:
-                        return series
-
-        # If no exact match found and year is provided, try title-only match
-        if year:
-            for series in series_list:
-                series_title = series.get('title', '').lower().strip()
-                if series_title == search_title:
-                    return series
-
-        return None
+        if not year:
+            # Any exact title or alternative title match
+            candidates = by_any_title.get(search_title)
+        else:
+            # Exact title (or alternative title) and year match, else fall
+            # back to a title-only match
+            candidates = by_title_year.get((search_title, year)) or by_title.get(search_title)
+
+        return candidates[0] if candidates else None
 
     def delete_series(self, plex_show, delete_files: bool = True, add_exclusion: bool = True) -> bool:
         """Delete a TV series from Sonarr.
@@ -125,20 +211,79 @@ class SonarrClient:
         success = self._delete(f"series/{series_id}", params=params)
 
         if success:
+            # Keep the cached index in step without refetching the catalog
+            self._forget_series([sonarr_series])
             click.echo(f"Successfully deleted '{title}' from Sonarr (files deleted: {delete_files}, exclusion added: {add_exclusion})")
         else:
             click.echo(f"Failed to delete '{title}' from Sonarr", err=True)
 
         return success
 
+    def delete_series_bulk(self, plex_shows, delete_files: bool = True, add_exclusion: bool = True):
+        """Delete several TV series from Sonarr with a single request.
+
+        Every show is resolved against the cached series list, and all found
+        series are removed through the series editor endpoint.
+
+        Args:
+            plex_shows: Plex shows, or any objects with ``title`` and ``year``
+            delete_files: Whether to delete series files from disk
+            add_exclusion: Whether to add the series to exclusion list (prevents re-downloading)
+
+        Returns:
+            Tuple of (deleted shows, shows that were not found or failed)
+        """
+        found = []
+        failed = []
+        found_series = []
+        for plex_show in plex_shows:
+            title = plex_show.title
+            year = getattr(plex_show, 'year', None)
+            sonarr_series = self.find_series_by_title(title, year)
+            if not sonarr_series:
+                click.echo(f"Series '{title}' ({year}) not found in Sonarr", err=True)
+                failed.append(plex_show)
+                continue
+            found.append(plex_show)
+            found_series.append(sonarr_series)
+
+        series_ids = [series['id'] for series in found_series]
+        if not series_ids:
+            return [], failed
+
+        body = {
+            'seriesIds': series_ids,
+            'deleteFiles': delete_files,
+            'addImportListExclusion': add_exclusion
+        }
+
+        if not self._delete("series/editor", json=body):
+            click.echo(f"Failed to delete {len(series_ids)} series from Sonarr", err=True)
+            return [], failed + found
+
+        self._forget_series(found_series)
+        click.echo(f"Successfully deleted {len(series_ids)} series from Sonarr (files deleted: {delete_files}, exclusion added: {add_exclusion})")
+        return found, failed
+
     def get_series_by_id(self, series_id: int) -> Optional[Dict]:
         """Get series details by Sonarr ID."""
         return self._get(f"series/{series_id}")
 
+    def get_status(self) -> Optional[Dict]:
+        """Return Sonarr's system status, reusing it for STATUS_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if self._status is None or now - self._status_fetched >= STATUS_CACHE_TTL:
+            status = self._get("system/status")
+            if not status:
+                return None
+            self._status = status
+            self._status_fetched = now
+        return self._status
+
     def test_connection(self) -> bool:
         """Test the connection to Sonarr."""
         try:
-            result = self._get("system/status")
+            result = self.get_status()
             if result:
                 click.echo(f"Connected to Sonarr v{result.get('version', 'unknown')}")
                 return True
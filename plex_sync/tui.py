@@ -0,0 +1,411 @@
+"""Textual views used by the plex-sync commands.
+
+Kept out of the command modules so commands that never open a TUI, and
+``--help``, don't pay for importing Textual.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from textual import work
+from textual.app import App, ComposeResult
+from textual.widgets import DataTable, Footer, Header, Input
+from textual.containers import Container
+from textual.binding import Binding
+
+# Number of concurrent Radarr delete requests
+RADARR_DELETE_WORKERS = 8
+
+
+class LibraryListApp(App):
+    """Textual app for displaying library content table."""
+    
+    def __init__(self, content_data, content_type):
+        super().__init__()
+        self.content_data = content_data
+        self.content_type = content_type
+    
+    def compose(self) -> ComposeResult:
+        yield Container(
+            DataTable(id="content_table")
+        )
+    
+    def on_mount(self) -> None:
+        table = self.query_one("#content_table", DataTable)
+        table.cursor_type = "row"
+        
+        if self.content_type == "show":
+            table.add_columns("Show", "Total Episodes", "Unwatched", "% Unwatched")
+            
+            rows = []
+            for show_data in self.content_data:
+                show_title = show_data["title"]
+                total_episodes = show_data["total_episodes"]
+                unwatched_episodes = show_data["unwatched_episodes"]
+                unwatched_percentage = (unwatched_episodes / total_episodes * 100) if total_episodes > 0 else 0
+                
+                rows.append((
+                    show_title,
+                    str(total_episodes),
+                    str(unwatched_episodes),
+                    f"{unwatched_percentage:.1f}%"
+                ))
+            table.add_rows(rows)
+        elif self.content_type == "movie":
+            table.add_columns("Movie", "Year", "Duration")
+            
+            rows = []
+            for movie_data in self.content_data:
+                movie_title = movie_data["title"]
+                year = str(movie_data.get("year", ""))
+                duration = movie_data.get("duration", "")
+                
+                rows.append((movie_title, year, duration))
+            table.add_rows(rows)
+
+
+class MovieSizeApp(App):
+    """Textual app for displaying movie size table."""
+
+    CSS = """
+    Screen {
+        background: $surface;
+    }
+
+    DataTable {
+        height: 1fr;
+    }
+    """
+
+    BINDINGS = [
+        Binding("space", "toggle_select", "Select/Deselect", show=True),
+        Binding("d", "delete_selected", "Delete Selected", show=True),
+        Binding("q", "quit", "Quit", show=True),
+    ]
+
+    def __init__(self, movies_data, rows, radarr_client=None):
+        """``movies_data`` holds ``(movie, size_bytes, library_name)`` tuples
+        and ``rows`` the already formatted table row for each of them."""
+        super().__init__()
+        self.movies_data = movies_data
+        self.rows = rows
+        self.radarr_client = radarr_client
+        # One byte per row, 1 when selected; rows are in movies_data order
+        self.selected = bytearray(len(movies_data))
+        self._row_keys = []  # Row keys in display order
+        self._checkbox_col_key = None
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Container(
+            DataTable(id="movie_table")
+        )
+        yield Footer()
+
+    def on_mount(self) -> None:
+        table = self.query_one("#movie_table", DataTable)
+        table.cursor_type = "row"
+
+        # Add columns, the checkbox column first
+        self._checkbox_col_key, *_ = table.add_columns("✓", "Rank", "Library", "Movie", "Duration", "Size (GB)", "GB/min", "Rating", "Audience")
+
+        self._row_keys = table.add_rows(self.rows)
+
+    def action_toggle_select(self) -> None:
+        """Toggle selection of the current row."""
+        table = self.query_one("#movie_table", DataTable)
+        if table.cursor_row is not None:
+            row_index = table.cursor_row
+            # Rows are never reordered, so the keys cached in on_mount stay
+            # in display order
+            if row_index < len(self._row_keys):
+                self.selected[row_index] ^= 1
+                # Update the checkbox column (first column)
+                table.update_cell(
+                    self._row_keys[row_index],
+                    self._checkbox_col_key,
+                    "✓" if self.selected[row_index] else " ",
+                )
+
+    def action_delete_selected(self) -> None:
+        """Delete selected movies via Radarr API."""
+        if not any(self.selected):
+            self.notify("No movies selected", severity="warning")
+            return
+
+        if not self.radarr_client:
+            self.notify("Radarr client not configured", severity="error")
+            return
+
+        # Get movie objects for selected rows
+        selected_movies = [
+            movie
+            for (movie, _, _), is_selected in zip(self.movies_data, self.selected)
+            if is_selected
+        ]
+
+        self.notify(f"Deleting {len(selected_movies)} movies via Radarr...", severity="information")
+
+        # Clear selections up front so pressing d again while the deletes run
+        # doesn't queue the same movies twice, unticking their checkboxes in
+        # one repaint
+        table = self.query_one("#movie_table", DataTable)
+        with self.batch_update():
+            for row_key, is_selected in zip(self._row_keys, self.selected):
+                if is_selected:
+                    table.update_cell(row_key, self._checkbox_col_key, " ")
+        self.selected = bytearray(len(self.movies_data))
+        self._delete_movies(selected_movies)
+
+    @work(thread=True)
+    def _delete_movies(self, movies) -> None:
+        """Delete movies through Radarr concurrently, off the UI thread."""
+        with ThreadPoolExecutor(max_workers=RADARR_DELETE_WORKERS) as executor:
+            futures = {
+                executor.submit(self.radarr_client.delete_movie, movie): movie
+                for movie in movies
+            }
+            for future in as_completed(futures):
+                movie = futures[future]
+                try:
+                    if future.result():
+                        self.call_from_thread(
+                            self.notify, f"Deleted: {movie.title}", severity="success"
+                        )
+                    else:
+                        self.call_from_thread(
+                            self.notify,
+                            f"Failed to delete: {movie.title}",
+                            severity="error",
+                        )
+                except Exception as e:
+                    self.call_from_thread(
+                        self.notify,
+                        f"Error deleting {movie.title}: {str(e)}",
+                        severity="error",
+                    )
+
+        self.call_from_thread(self.notify, "Deletion complete", severity="success")
+
+
+class ShowSizeApp(App):
+    """Textual app for displaying TV show size table."""
+
+    CSS = """
+    Screen {
+        background: $surface;
+    }
+
+    DataTable {
+        height: 1fr;
+    }
+
+    #filter {
+        dock: bottom;
+        display: none;
+    }
+    """
+
+    BINDINGS = [
+        Binding("space", "toggle_select", "Select/Deselect", show=True),
+        Binding("shift+down", "extend_selection(1)", "Extend Selection", show=True),
+        Binding("shift+up", "extend_selection(-1)", "Extend Selection", show=False),
+        Binding("d", "delete_selected", "Delete Selected", show=True),
+        Binding("s", "toggle_view", "Toggle Season/Show View", show=True),
+        Binding("/", "filter", "Filter", show=True),
+        Binding("escape", "close_filter", "Close Filter", show=False),
+        Binding("q", "quit", "Quit", show=True),
+    ]
+
+    COLUMNS = {
+        "show": ("✓", "Rank", "Library", "Show", "Episodes", "Size (GB)", "GB/ep", "Rating", "Audience"),
+        "season": ("✓", "Rank", "Library", "Show - Season", "Episodes", "Size (GB)", "GB/ep"),
+    }
+
+    def __init__(self, views, sonarr_client=None):
+        """``views`` maps each view mode to its ``(rows, targets)`` as built
+        by ``show_size.format_show_rows``."""
+        super().__init__()
+        self.views = views
+        self.sonarr_client = sonarr_client
+        self.selected_rows = set()
+        self.row_to_show = {}  # Maps row key to (show, season_num)
+        self.view_mode = "show"  # "show" or "season"
+        self.filter_text = ""  # Casefolded title filter, empty for all rows
+        self._row_keys = []  # Row keys in display order
+        self._checkbox_col_key = None
+        self._range_anchor = None  # Row index of the last toggled row
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Container(
+            DataTable(id="show_table")
+        )
+        yield Input(placeholder="Filter by title, empty to clear", id="filter")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        table = self.query_one("#show_table", DataTable)
+        table.cursor_type = "row"
+        # The hidden filter input must not take the keys meant for the table
+        table.focus()
+
+        # Populate the table (this adds columns and data)
+        self.populate_table()
+
+    def populate_table(self):
+        """Populate the table with the pre-formatted rows of the current view."""
+        table = self.query_one("#show_table", DataTable)
+        table.clear(columns=True)  # Clear both rows and columns
+        self.selected_rows.clear()
+        self._range_anchor = None
+
+        self._checkbox_col_key, *_ = table.add_columns(*self.COLUMNS[self.view_mode])
+
+        rows, targets = self.views[self.view_mode]
+        if self.filter_text:
+            # Title is the fourth column in both views
+            matches = [
+                (row, target)
+                for row, target in zip(rows, targets)
+                if self.filter_text in row[3].casefold()
+            ]
+            rows = [row for row, _ in matches]
+            targets = [target for _, target in matches]
+        self._row_keys = table.add_rows(rows)
+
+        # Store show reference for each row
+        self.row_to_show = dict(zip(self._row_keys, targets))
+
+    def action_toggle_select(self) -> None:
+        """Toggle selection of the current row."""
+        table = self.query_one("#show_table", DataTable)
+        if table.cursor_row is not None:
+            row_index = table.cursor_row
+
+            if row_index < len(self._row_keys):
+                row_key = self._row_keys[row_index]
+                self._range_anchor = row_index
+
+                if row_key in self.selected_rows:
+                    self.selected_rows.remove(row_key)
+                    # Update the checkbox column (first column)
+                    table.update_cell(row_key, self._checkbox_col_key, " ")
+                else:
+                    self.selected_rows.add(row_key)
+                    # Update the checkbox column (first column)
+                    table.update_cell(row_key, self._checkbox_col_key, "✓")
+
+    def action_extend_selection(self, step: int) -> None:
+        """Move the cursor ``step`` rows and select every row from the last
+        toggled row (or the starting row) to it."""
+        table = self.query_one("#show_table", DataTable)
+        if table.cursor_row is None or table.cursor_row >= len(self._row_keys):
+            return
+
+        if self._range_anchor is None:
+            self._range_anchor = table.cursor_row
+        table.move_cursor(row=table.cursor_row + step, animate=False)
+
+        start, end = sorted((self._range_anchor, table.cursor_row))
+
+        # Update all checkboxes in one repaint instead of one per row
+        with self.batch_update():
+            for row_key in self._row_keys[start:end + 1]:
+                if row_key not in self.selected_rows:
+                    self.selected_rows.add(row_key)
+                    table.update_cell(row_key, self._checkbox_col_key, "✓")
+
+    def action_delete_selected(self) -> None:
+        """Delete selected TV shows via Sonarr API."""
+        if not self.selected_rows:
+            self.notify("No shows selected", severity="warning")
+            return
+
+        if not self.sonarr_client:
+            self.notify("Sonarr client not configured", severity="error")
+            return
+
+        # Get show objects for selected rows (only shows, not individual seasons)
+        selected_shows = []
+        seen = set()
+        for row_key in self.selected_rows:
+            if row_key in self.row_to_show:
+                show, season_num = self.row_to_show[row_key]
+                # Only delete entire shows, not individual seasons
+                if id(show) not in seen:
+                    seen.add(id(show))
+                    selected_shows.append(show)
+
+        if not selected_shows:
+            self.notify("No shows selected", severity="warning")
+            return
+
+        self.notify(f"Deleting {len(selected_shows)} shows via Sonarr...", severity="information")
+
+        # Clear selections up front so pressing d again while the delete runs
+        # doesn't queue the same shows twice, unticking their checkboxes in
+        # one repaint
+        table = self.query_one("#show_table", DataTable)
+        with self.batch_update():
+            for row_key in self.selected_rows:
+                table.update_cell(row_key, self._checkbox_col_key, " ")
+        self.selected_rows.clear()
+        self._delete_shows(selected_shows)
+
+    @work(thread=True)
+    def _delete_shows(self, shows) -> None:
+        """Delete shows through one Sonarr bulk request, off the UI thread."""
+        try:
+            deleted, failed = self.sonarr_client.delete_series_bulk(shows)
+        except Exception as e:
+            self.call_from_thread(
+                self.notify, f"Error deleting shows: {str(e)}", severity="error"
+            )
+            return
+
+        if deleted:
+            # Deleted shows must not come back from the size cache
+            from .show_size import forget_cached_sizes
+
+            forget_cached_sizes([show.rating_key for show in deleted])
+
+        for show in deleted:
+            self.call_from_thread(
+                self.notify, f"Deleted: {show.title}", severity="success"
+            )
+        for show in failed:
+            self.call_from_thread(
+                self.notify, f"Failed to delete: {show.title}", severity="error"
+            )
+
+        self.call_from_thread(self.notify, "Deletion complete", severity="success")
+
+    def action_toggle_view(self) -> None:
+        """Toggle between show view and season view."""
+        self.view_mode = "season" if self.view_mode == "show" else "show"
+        self.populate_table()
+        self.notify(f"Switched to {self.view_mode} view")
+
+    def action_filter(self) -> None:
+        """Show the title filter input."""
+        filter_input = self.query_one("#filter", Input)
+        filter_input.display = True
+        filter_input.focus()
+
+    def action_close_filter(self) -> None:
+        """Clear and hide the title filter input, showing every row again."""
+        filter_input = self.query_one("#filter", Input)
+        if not filter_input.display:
+            return
+        filter_input.value = ""
+        filter_input.display = False
+        if self.filter_text:
+            self.filter_text = ""
+            self.populate_table()
+        self.query_one("#show_table", DataTable).focus()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Apply the title filter and return to the table."""
+        self.filter_text = event.value.strip().casefold()
+        event.input.display = False
+        self.populate_table()
+        self.query_one("#show_table", DataTable).focus()
@@ -0,0 +1,24 @@
+import pytest
+
+from plex_sync import config
+
+
+@pytest.fixture
+def config_home(tmp_path, monkeypatch):
+    """Run with an empty home and working directory and fresh config caches.
+
+    Returns the working directory, where a ``config.yml`` written by the test
+    is the first config file found.
+    """
+    home = tmp_path / "home"
+    workdir = tmp_path / "work"
+    home.mkdir()
+    workdir.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(workdir)
+    for name in ("PLEX_SYNC_CONFIG", "PLEX_URL", "PLEX_TOKEN", "XDG_CONFIG_HOME"):
+        monkeypatch.delenv(name, raising=False)
+
+    config.cache_clear()
+    yield workdir
+    config.cache_clear()
@@ -0,0 +1,75 @@
+"""Minimal stand-ins for the plexapi objects plex_sync reads."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+
+def make_episode(show_key, season, number, file, size=None, aired=None):
+    """An episode with a single media part at ``file``."""
+    return SimpleNamespace(
+        title=f"Episode {number}",
+        grandparentRatingKey=show_key,
+        parentIndex=season,
+        seasonNumber=season,
+        episodeNumber=number,
+        originallyAvailableAt=aired or datetime(2020, season, number),
+        addedAt=datetime(2021, 1, 1),
+        media=[SimpleNamespace(parts=[SimpleNamespace(file=file, size=size)])],
+    )
+
+
+class FakeShow:
+    def __init__(self, rating_key, title, episodes=(), viewed=0,
+                 updated_at=datetime(2024, 1, 1), year=None):
+        self.ratingKey = rating_key
+        self.title = title
+        self.year = year
+        self.episodes = list(episodes)
+        self.leafCount = len(self.episodes)
+        self.viewedLeafCount = viewed
+        self.updatedAt = updated_at
+        self.rating = None
+        self.audienceRating = None
+
+    def unwatched(self):
+        return self.episodes[self.viewedLeafCount:]
+
+
+class FakeSection:
+    """A show library; ``searches`` records the episode searches made."""
+
+    type = "show"
+
+    def __init__(self, title, shows=(), key=1, error=None):
+        self.title = title
+        self.key = key
+        self.shows = list(shows)
+        self.error = error
+        self.searches = []
+
+    def all(self):
+        if self.error:
+            raise self.error
+        return list(self.shows)
+
+    def search(self, libtype=None, filters=None, maxresults=None, **kwargs):
+        if libtype == "show":
+            return self.all()
+
+        self.searches.append(filters)
+        show_ids = (filters or {}).get("show.id")
+        if show_ids is not None and not isinstance(show_ids, list):
+            show_ids = [show_ids]
+        episodes = []
+        for show in self.shows:
+            if show_ids is None or show.ratingKey in show_ids:
+                if (filters or {}).get("episode.unwatched"):
+                    episodes.extend(show.unwatched())
+                else:
+                    episodes.extend(show.episodes)
+        return episodes[:maxresults] if maxresults else episodes
+
+
+class FakePlex:
+    def __init__(self, *sections):
+        self.library = SimpleNamespace(sections=lambda: list(sections))
@@ -0,0 +1,86 @@
+from plex_sync import config
+
+
+def test_load_config_returns_independent_copies(config_home):
+    (config_home / "config.yml").write_text(
+        "plex:\n  url: http://plex.example:32400\n"
+    )
+
+    first = config.load_config()
+    first["plex"]["url"] = "http://changed"
+    first["rsync"]["options"] = "-n"
+
+    second = config.load_config()
+    assert second["plex"]["url"] == "http://plex.example:32400"
+    assert second["rsync"]["options"] == "-avP"
+    assert config.DEFAULT_CONFIG["rsync"]["options"] == "-avP"
+
+
+def test_cache_clear_rereads_edited_file(config_home):
+    config_file = config_home / "config.yml"
+    config_file.write_text("plex:\n  url: http://old\n  token: old-token\n")
+    assert config.load_config()["plex"]["token"] == "old-token"
+
+    config_file.write_text("plex:\n  url: http://new\n  token: new-token\n")
+    # Cached until cleared
+    assert config.load_config()["plex"]["url"] == "http://old"
+
+    config.load_config.cache_clear()
+    cfg = config.load_config()
+    assert cfg["plex"]["url"] == "http://new"
+    assert cfg["plex"]["token"] == "new-token"
+
+
+def test_missing_explicit_config_falls_back_to_defaults(config_home, monkeypatch, capsys):
+    monkeypatch.setenv("PLEX_SYNC_CONFIG", str(config_home / "missing.yml"))
+    # Not picked up while the explicit path is set
+    (config_home / "config.yml").write_text("plex:\n  token: ignored\n")
+
+    assert config.get_config_path() is None
+    assert config.load_config()["plex"] == config.DEFAULT_CONFIG["plex"]
+    assert "missing.yml from PLEX_SYNC_CONFIG not found" in capsys.readouterr().out
+
+
+def test_explicit_config_is_used(config_home, monkeypatch):
+    explicit = config_home / "elsewhere.toml"
+    explicit.write_text('[plex]\ntoken = "from-toml"\n')
+    monkeypatch.setenv("PLEX_SYNC_CONFIG", str(explicit))
+
+    assert config.get_config_path() == explicit
+    assert config.load_config()["plex"]["token"] == "from-toml"
+
+
+def test_plan_sync_applies_default_and_per_show_limits():
+    cfg = {
+        "sync": {
+            "defaults": {"episode_limit": 3},
+            "TV": ["Plain", {"name": "Custom", "episode_limit": 7}, {"name": "Dict"}],
+            "Anime": None,
+        }
+    }
+
+    assert config.plan_sync(cfg) == [
+        ("TV", [("Plain", 3), ("Custom", 7), ("Dict", 3)]),
+        ("Anime", []),
+    ]
+
+
+def test_plan_sync_without_defaults_uses_builtin_limit():
+    assert config.plan_sync({"sync": {"TV": ["Show"]}}) == [
+        ("TV", [("Show", config.DEFAULT_EPISODE_LIMIT)])
+    ]
+    assert config.plan_sync({}) == []
+
+
+def test_deep_update_merges_nested_dicts():
+    source = {"plex": {"url": "http://a", "token": ""}, "rsync": {"options": "-a"}}
+
+    config.deep_update(
+        source, {"plex": {"token": "secret"}, "rsync": "replaced", "new": {"x": 1}}
+    )
+
+    assert source == {
+        "plex": {"url": "http://a", "token": "secret"},
+        "rsync": "replaced",
+        "new": {"x": 1},
+    }
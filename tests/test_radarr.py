@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pytest
+
+from plex_sync.radarr import RadarrClient
+
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def radarr():
+    client = RadarrClient("http://radarr", "key")
+    client.fetches = 0
+    movies = [
+        {"id": 1, "title": "Alien", "year": 1979,
+         "alternateTitles": [{"title": "Alien: The Director's Cut"}]},
+        {"id": 2, "title": "Alien", "year": 2030},
+        {"id": 3, "title": "Heat", "year": 1995},
+    ]
+
+    def get(endpoint):
+        client.fetches += 1
+        return movies
+
+    client._get = get
+    client.deletes = []
+    client.session.delete = lambda url, params=None: client.deletes.append(url) or FakeResponse()
+    return client
+
+
+def test_radarr_finds_by_title_year_and_alternate_title(radarr):
+    assert radarr.find_movie_by_title("Alien", 2030)["id"] == 2
+    assert radarr.find_movie_by_title(" alien ")["id"] == 1
+    assert radarr.find_movie_by_title("Alien: the director's cut")["id"] == 1
+    # Unknown year falls back to the first title match
+    assert radarr.find_movie_by_title("Heat", 1990)["id"] == 3
+    assert radarr.find_movie_by_title("Missing") is None
+    assert radarr.fetches == 1
+
+
+def test_radarr_delete_updates_index_without_refetch(radarr):
+    movie = SimpleNamespace(title="Alien", year=1979)
+
+    assert radarr.delete_movie(movie)
+
+    assert radarr.deletes == ["http://radarr/api/v3/movie/1"]
+    assert radarr.find_movie_by_title("Alien")["id"] == 2
+    assert radarr.find_movie_by_title("Alien: The Director's Cut") is None
+    assert radarr.fetches == 1
+
+
+def test_radarr_delete_of_unknown_movie_fails(radarr):
+    assert not radarr.delete_movie(SimpleNamespace(title="Nope", year=None))
+    assert radarr.deletes == []
@@ -0,0 +1,153 @@
+import io
+
+import pytest
+
+from plex_sync import main
+
+
+class FakePopen:
+    """Records the rsync command line and the NUL-separated file list."""
+
+    instances = []
+    exit_code = 0
+
+    def __init__(self, cmd, **kwargs):
+        self.cmd = cmd
+        self.stdin = io.StringIO()
+        self.stdout = io.StringIO("")
+        self.returncode = None
+        self.terminated = False
+        self.files = []
+        self.stdin.close = self._close_stdin
+        FakePopen.instances.append(self)
+
+    def _close_stdin(self):
+        if not self.stdin.closed:
+            self.files = [path for path in self.stdin.getvalue().split("\0") if path]
+            io.StringIO.close(self.stdin)
+
+    def poll(self):
+        # rsync "finishes" once it has read the whole list
+        if self.returncode is None and self.stdin.closed:
+            self.returncode = self.exit_code
+        return self.returncode
+
+    def wait(self):
+        if self.returncode is None:
+            self.returncode = self.exit_code
+        return self.returncode
+
+    def terminate(self):
+        self.terminated = True
+        self.returncode = -15
+
+
+@pytest.fixture
+def fake_popen(monkeypatch):
+    FakePopen.instances = []
+    monkeypatch.setattr(main.subprocess, "Popen", FakePopen)
+    return FakePopen
+
+
+def rsync_config(target):
+    return {
+        "rsync": {
+            "server_path": "/media",
+            "target": str(target),
+            "options": "-a",
+            "ssh_options": "",
+        }
+    }
+
+
+def test_failed_file_list_stops_started_rsyncs(tmp_path, fake_popen, monkeypatch):
+    class BusyPopen(fake_popen):
+        # Still transferring when the list fails
+        def poll(self):
+            return self.returncode
+
+    monkeypatch.setattr(main.subprocess, "Popen", BusyPopen)
+
+    def file_paths():
+        yield "/media/tv/show/e1.mkv"
+        raise RuntimeError("discovery failed")
+
+    with pytest.raises(RuntimeError):
+        main.sync_files_with_rsync(file_paths(), cfg=rsync_config(tmp_path / "dest"))
+
+    (transfer,) = fake_popen.instances
+    assert transfer.stdin.closed
+    assert transfer.terminated
+    assert transfer.stdout.closed
+
+
+def test_files_are_grouped_into_one_rsync_per_source_root(tmp_path, fake_popen, capsys):
+    dest = tmp_path / "dest"
+    paths = [
+        "/media/tv/a/e1.mkv",
+        "/media/tv/b/e 2.mkv",
+        "/media/tv/a/e1.mkv",  # configured twice
+        "/other/e3.mkv",
+    ]
+
+    main.sync_files_with_rsync(iter(paths), cfg=rsync_config(dest))
+
+    by_root = {proc.cmd[-2]: proc for proc in fake_popen.instances}
+    assert set(by_root) == {"/media/", "/"}
+    assert by_root["/media/"].cmd == [
+        "rsync", "-a", "--files-from=-", "--from0", "/media/", f"{dest}/",
+    ]
+    assert by_root["/media/"].files == ["tv/a/e1.mkv", "tv/b/e 2.mkv"]
+    assert by_root["/"].files == ["other/e3.mkv"]
+    output = capsys.readouterr().out
+    assert "doesn't start with server_path" in output
+    assert "Successfully synced: /media/tv/b/e 2.mkv" in output
+
+
+def test_local_files_with_matching_size_are_skipped(tmp_path, fake_popen, capsys):
+    dest = tmp_path / "dest"
+    (dest / "tv").mkdir(parents=True)
+    (dest / "tv" / "done.mkv").write_bytes(b"x" * 10)
+    (dest / "tv" / "partial.mkv").write_bytes(b"x" * 4)
+    sizes = {"/media/tv/done.mkv": 10, "/media/tv/partial.mkv": 10}
+
+    main.sync_files_with_rsync(
+        ["/media/tv/done.mkv", "/media/tv/partial.mkv", "/media/tv/new.mkv"],
+        cfg=rsync_config(dest),
+        file_sizes=sizes,
+    )
+
+    (transfer,) = fake_popen.instances
+    assert transfer.files == ["tv/partial.mkv", "tv/new.mkv"]
+    assert f"Already up to date: {dest}/tv/done.mkv" in capsys.readouterr().out
+
+
+def test_nothing_is_started_when_everything_is_up_to_date(tmp_path, fake_popen, capsys):
+    dest = tmp_path / "dest"
+    (dest / "tv").mkdir(parents=True)
+    (dest / "tv" / "done.mkv").write_bytes(b"x" * 10)
+
+    main.sync_files_with_rsync(
+        ["/media/tv/done.mkv"],
+        cfg=rsync_config(dest),
+        file_sizes={"/media/tv/done.mkv": 10},
+    )
+
+    assert fake_popen.instances == []
+    assert "All files are already up to date" in capsys.readouterr().out
+
+
+def test_failed_rsync_reports_its_files(tmp_path, fake_popen, monkeypatch, capsys):
+    class FailingPopen(fake_popen):
+        exit_code = 12
+
+        def __init__(self, cmd, **kwargs):
+            super().__init__(cmd, **kwargs)
+            self.stdout = io.StringIO("rsync: connection unexpectedly closed\n")
+
+    monkeypatch.setattr(main.subprocess, "Popen", FailingPopen)
+
+    main.sync_files_with_rsync(["/media/tv/e1.mkv"], cfg=rsync_config(tmp_path))
+
+    output = capsys.readouterr().out
+    assert "Error syncing /media/tv/e1.mkv: rsync: connection unexpectedly closed" in output
@@ -0,0 +1,135 @@
+from datetime import datetime
+
+from plex_sync import show_size
+
+from .plex_stubs import FakeSection, FakeShow, make_episode
+
+
+def make_section():
+    shows = [
+        FakeShow(1, "Big", [
+            make_episode(1, 1, 1, "/tv/big/s1e1.mkv", size=300),
+            make_episode(1, 2, 1, "/tv/big/s2e1.mkv", size=200),
+        ]),
+        FakeShow(2, "Small", [make_episode(2, 1, 1, "/tv/small/s1e1.mkv", size=50)]),
+    ]
+    return FakeSection("TV", shows, key=7)
+
+
+def test_size_cache_round_trip(config_home):
+    entries = {
+        1: {
+            "section_id": 7,
+            "updated_at": 1700000000,
+            "leaf_count": 2,
+            "size": 500,
+            "episodes": 2,
+            "seasons": {1: (300, 1), None: (200, 1)},
+        }
+    }
+
+    show_size.save_size_cache(entries)
+
+    assert show_size.load_size_cache() == entries
+
+
+def test_size_cache_drops_expired_entries(config_home, monkeypatch):
+    show_size.save_size_cache({
+        1: {"section_id": 7, "updated_at": 1, "leaf_count": 1, "size": 10,
+            "episodes": 1, "seasons": {1: (10, 1)}},
+    })
+    later = show_size.time.time() + show_size.SIZE_CACHE_MAX_AGE + 1
+    monkeypatch.setattr(show_size.time, "time", lambda: later)
+
+    assert show_size.load_size_cache() == {}
+
+
+def test_forget_cached_sizes(config_home):
+    entry = {"section_id": 7, "updated_at": 1, "leaf_count": 1, "size": 10,
+             "episodes": 1, "seasons": {1: (10, 1)}}
+    show_size.save_size_cache({1: entry, 2: entry})
+
+    show_size.forget_cached_sizes([1])
+
+    assert set(show_size.load_size_cache()) == {2}
+
+
+def test_scan_measures_every_show_on_cold_cache():
+    section = make_section()
+
+    rows, new_entries = show_size.scan_show_sizes(section, watched=False)
+
+    assert [(row.title, row.size, row.episodes) for row in rows] == [
+        ("Big", 500, 2), ("Small", 50, 1),
+    ]
+    assert rows[0].seasons == {1: (300, 1), 2: (200, 1)}
+    assert set(new_entries) == {1, 2}
+    assert all(entry["section_id"] == 7 for entry in new_entries.values())
+
+
+def test_scan_reuses_cached_sizes_of_unchanged_shows():
+    section = make_section()
+    _, cached = show_size.scan_show_sizes(section, watched=False)
+    section.searches.clear()
+
+    rows, new_entries = show_size.scan_show_sizes(section, False, cached)
+
+    assert new_entries == {}
+    assert section.searches == []
+    assert [row.size for row in rows] == [500, 50]
+
+
+def test_scan_remeasures_changed_shows_only():
+    section = make_section()
+    _, cached = show_size.scan_show_sizes(section, watched=False)
+    small = section.shows[1]
+    small.episodes.append(make_episode(2, 1, 2, "/tv/small/s1e2.mkv", size=25))
+    small.leafCount += 1
+    small.updatedAt = datetime(2024, 6, 1)
+    section.searches.clear()
+
+    rows, new_entries = show_size.scan_show_sizes(section, False, cached)
+
+    assert set(new_entries) == {2}
+    assert new_entries[2]["size"] == 75
+    # Only the changed show's episodes were listed
+    assert section.searches == [{"show.id": [2]}]
+    assert [row.size for row in rows] == [500, 75]
+
+
+def test_cli_rejects_negative_limit():
+    from click.testing import CliRunner
+
+    result = CliRunner().invoke(show_size.cli, ["--limit", "-1"])
+
+    assert result.exit_code == 2
+    assert "must be 0 or greater" in result.output
+
+
+def test_cli_closes_its_plex_session_before_showing_the_table(config_home, monkeypatch):
+    from click.testing import CliRunner
+
+    from plex_sync import tui
+
+    from .plex_stubs import FakePlex
+
+    events = []
+
+    def get_plex_server(session):
+        monkeypatch.setattr(session, "close", lambda: events.append("closed"))
+        return FakePlex(make_section())
+
+    class FakeApp:
+        def __init__(self, views, sonarr_client=None):
+            self.views = views
+
+        def run(self):
+            events.append(("run", len(self.views["show"][0])))
+
+    monkeypatch.setattr(show_size, "get_plex_server", get_plex_server)
+    monkeypatch.setattr(tui, "ShowSizeApp", FakeApp)
+
+    result = CliRunner().invoke(show_size.cli, [])
+
+    assert result.exit_code == 0, result.output
+    assert events == ["closed", ("run", 2)]
@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import pytest
+
+from plex_sync import sonarr
+from plex_sync.sonarr import SonarrClient
+
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def sonarr_client(monkeypatch):
+    client = SonarrClient("http://sonarr", "key")
+    client.fetches = 0
+    series = [
+        {"id": 10, "title": "The Office", "year": 2005,
+         "alternateTitles": [{"title": "The Office (US)"}]},
+        {"id": 11, "title": "The Office", "year": 2001},
+        {"id": 12, "title": "Lost", "year": 2004},
+    ]
+
+    def get(endpoint):
+        client.fetches += 1
+        return series
+
+    client._get = get
+    client.deletes = []
+    client.session.delete = (
+        lambda url, params=None, json=None: client.deletes.append((url, json)) or FakeResponse()
+    )
+    # Don't actually wait between deletes
+    monkeypatch.setattr(sonarr.time, "sleep", lambda seconds: None)
+    return client
+
+
+def test_sonarr_bulk_delete_sends_one_request(sonarr_client):
+    shows = [
+        SimpleNamespace(title="The Office", year=2005),
+        SimpleNamespace(title="Lost", year=2004),
+        SimpleNamespace(title="Missing", year=None),
+    ]
+
+    deleted, failed = sonarr_client.delete_series_bulk(shows, add_exclusion=False)
+
+    assert deleted == shows[:2]
+    assert failed == shows[2:]
+    assert sonarr_client.deletes == [(
+        "http://sonarr/api/v3/series/editor",
+        {"seriesIds": [10, 12], "deleteFiles": True, "addImportListExclusion": False},
+    )]
+    # The index no longer knows the deleted series but still has the rest
+    assert sonarr_client.find_series_by_title("Lost") is None
+    assert sonarr_client.find_series_by_title("The Office (US)") is None
+    assert sonarr_client.find_series_by_title("The Office")["id"] == 11
+    assert sonarr_client.fetches == 1
+
+
+def test_sonarr_bulk_delete_failure_keeps_index(sonarr_client):
+    def failing_delete(url, params=None, json=None):
+        raise sonarr.requests.exceptions.ConnectionError("down")
+
+    sonarr_client.session.delete = failing_delete
+    shows = [SimpleNamespace(title="Lost", year=2004)]
+
+    assert sonarr_client.delete_series_bulk(shows) == ([], shows)
+    assert sonarr_client.find_series_by_title("Lost")["id"] == 12
+
+
+def test_sonarr_spaces_out_deletes(monkeypatch):
+    client = SonarrClient("http://sonarr", "key")
+    clock = [100.0]
+    sleeps = []
+    monkeypatch.setattr(sonarr.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(sonarr.time, "sleep", sleeps.append)
+
+    for _ in range(3):
+        client._wait_for_delete_slot()
+
+    interval = 1 / sonarr.DELETES_PER_SECOND
+    assert sleeps == pytest.approx([interval, 2 * interval])
+
+
+def test_sonarr_reuses_status_within_ttl(monkeypatch):
+    client = SonarrClient("http://sonarr", "key")
+    clock = [100.0]
+    calls = []
+    monkeypatch.setattr(sonarr.time, "monotonic", lambda: clock[0])
+    client._get = lambda endpoint: calls.append(endpoint) or {"version": "4"}
+
+    client.get_status()
+    clock[0] += sonarr.STATUS_CACHE_TTL - 1
+    client.get_status()
+    assert calls == ["system/status"]
+
+    clock[0] += 1
+    client.get_status()
+    assert calls == ["system/status", "system/status"]
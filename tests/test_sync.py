@@ -0,0 +1,128 @@
+import pytest
+
+from plex_sync import main
+
+from .plex_stubs import FakePlex, FakeSection, FakeShow, make_episode
+
+
+def sync_config(**libraries):
+    return {"sync": {"defaults": {"episode_limit": 2}, **libraries}}
+
+
+def test_sync_skips_library_whose_listing_fails(config_home, capsys):
+    show = FakeShow(1, "Good Show", [make_episode(1, 1, 1, "/media/tv/good/e1.mkv")])
+    plex = FakePlex(
+        FakeSection("Broken", error=RuntimeError("section went away")),
+        FakeSection("TV", [show], key=2),
+    )
+    cfg = sync_config(Broken=["Anything"], TV=["Good Show"])
+
+    files, show_cache, _ = main.collect_sync_files(cfg, plex)
+
+    assert files == ["/media/tv/good/e1.mkv"]
+    assert "1" in show_cache
+    output = capsys.readouterr().out
+    assert "Error processing library 'Broken': section went away" in output
+
+
+def test_stream_sync_saves_finished_shows_when_rsync_fails(config_home, monkeypatch):
+    show = FakeShow(1, "Good Show", [make_episode(1, 1, 1, "/media/tv/good/e1.mkv")])
+    plex = FakePlex(FakeSection("TV", [show]))
+
+    def failing_rsync(file_paths, cfg=None, file_sizes=None):
+        next(iter(file_paths))
+        raise RuntimeError("rsync interrupted")
+
+    monkeypatch.setattr(main, "sync_files_with_rsync", failing_rsync)
+
+    with pytest.raises(RuntimeError):
+        main.stream_sync(sync_config(TV=["Good Show"]), plex)
+
+    assert main.load_synced_files() == ["/media/tv/good/e1.mkv"]
+    assert "1" in main.load_show_cache()
+
+
+def make_show_library():
+    show = FakeShow(1, "Show", [
+        make_episode(1, 1, number, f"/media/tv/show/e{number}.mkv", size=100)
+        for number in range(1, 5)
+    ])
+    return show, FakeSection("TV", [show])
+
+
+def sync_and_save(cfg, plex):
+    files, show_cache, file_sizes = main.collect_sync_files(cfg, plex)
+    main.save_synced_files(files, shows=show_cache, sizes=file_sizes)
+    return files
+
+
+def test_unchanged_show_reuses_cached_files(config_home, capsys):
+    show, section = make_show_library()
+    plex = FakePlex(section)
+    cfg = sync_config(TV=["Show"])
+    first = sync_and_save(cfg, plex)
+    section.searches.clear()
+
+    assert sync_and_save(cfg, plex) == first
+    assert section.searches == []
+    assert "reusing cached files for 'Show'" in capsys.readouterr().out
+
+
+def test_watching_an_episode_invalidates_cached_show(config_home):
+    show, section = make_show_library()
+    plex = FakePlex(section)
+    cfg = sync_config(TV=["Show"])
+    assert sync_and_save(cfg, plex) == ["/media/tv/show/e1.mkv", "/media/tv/show/e2.mkv"]
+    section.searches.clear()
+
+    # Watching does not have to touch updatedAt
+    show.viewedLeafCount = 1
+
+    assert sync_and_save(cfg, plex) == ["/media/tv/show/e2.mkv", "/media/tv/show/e3.mkv"]
+    assert len(section.searches) == 1
+
+
+def test_changing_the_limit_invalidates_cached_show(config_home):
+    show, section = make_show_library()
+    plex = FakePlex(section)
+    sync_and_save(sync_config(TV=["Show"]), plex)
+    section.searches.clear()
+
+    files = sync_and_save(sync_config(TV=[{"name": "Show", "episode_limit": 3}]), plex)
+
+    assert len(files) == 3
+    assert len(section.searches) == 1
+
+
+def test_expired_show_cache_is_refetched(config_home, monkeypatch):
+    show, section = make_show_library()
+    plex = FakePlex(section)
+    cfg = sync_config(TV=["Show"])
+    sync_and_save(cfg, plex)
+    section.searches.clear()
+
+    later = main.time.time() + main.SHOW_CACHE_MAX_AGE + 1
+    monkeypatch.setattr(main.time, "time", lambda: later)
+
+    assert main.load_show_cache() == {}
+    sync_and_save(cfg, plex)
+    assert len(section.searches) == 1
+
+
+def test_missing_show_cache_fetches_quietly(config_home, capsys):
+    show, section = make_show_library()
+
+    assert main.load_show_cache() == {}
+    assert sync_and_save(sync_config(TV=["Show"]), FakePlex(section))
+    assert len(section.searches) == 1
+    assert "Error loading show cache" not in capsys.readouterr().out
+
+
+def test_corrupt_show_cache_is_reported_and_ignored(config_home, capsys):
+    show, section = make_show_library()
+    main.get_cache_path().write_bytes(b"{not json")
+
+    assert sync_and_save(sync_config(TV=["Show"]), FakePlex(section))
+
+    assert len(section.searches) == 1
+    assert "Error loading show cache" in capsys.readouterr().out
@@ -0,0 +1,37 @@
+import asyncio
+
+from textual.widgets import DataTable, Input
+
+from plex_sync.show_size import ShowRow, format_show_rows
+from plex_sync.tui import ShowSizeApp
+
+
+def make_show_app():
+    rows = [
+        ShowRow(key, title, None, "TV", None, None, size, 1, {1: (size, 1)})
+        for key, title, size in ((1, "Alpha", 300), (2, "Beta", 200), (3, "Alphabet", 100))
+    ]
+    return ShowSizeApp({mode: format_show_rows(rows, mode) for mode in ("show", "season")})
+
+
+def test_show_filter_applies_and_escape_clears_it():
+    async def run():
+        app = make_show_app()
+        async with app.run_test() as pilot:
+            table = app.query_one("#show_table", DataTable)
+            filter_input = app.query_one("#filter", Input)
+            assert app.focused is table
+
+            await pilot.press("/", "a", "l", "p", "enter")
+            assert table.row_count == 2
+            assert not filter_input.display
+
+            await pilot.press("/", "x")
+            assert filter_input.display
+            await pilot.press("escape")
+            assert not filter_input.display
+            assert filter_input.value == ""
+            assert table.row_count == 3
+            assert app.focused is table
+
+    asyncio.run(run())